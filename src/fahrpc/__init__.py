@@ -30,12 +30,42 @@ License: MIT
 __version__ = "1.0.4"
 __author__ = "Bandokii"
 
-from .config import APP_AUTHOR, APP_NAME, get_config_dir, get_log_path, load_config
-from .discord_rpc import DiscordRPC
-from .hardware import GPUMonitor
+import importlib
+from typing import TYPE_CHECKING, Any
+
+from .config import APP_AUTHOR, APP_NAME, get_config, get_config_dir, get_log_path, load_config, reload_config
 from .logger import setup_error_logging
-from .scraper import FAHScraper
-from .tray import TrayIcon, set_console_visibility
+
+if TYPE_CHECKING:
+    from .discord_rpc import DiscordRPC
+    from .hardware import GPUMonitor
+    from .scraper import FAHScraper, shutdown_browser
+    from .tray import TrayIcon, set_console_visibility
+
+# Heavy submodules (pynvml/pyadl, Playwright, pypresence, pystray/Pillow) are
+# imported on first attribute access (PEP 562) so config loading and
+# fail-fast paths don't pay their import cost
+_LAZY_ATTRS = {
+    'DiscordRPC': '.discord_rpc',
+    'GPUMonitor': '.hardware',
+    'FAHScraper': '.scraper',
+    'shutdown_browser': '.scraper',
+    'TrayIcon': '.tray',
+    'set_console_visibility': '.tray',
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
 
 __all__ = [
     # Package metadata
@@ -43,6 +73,8 @@ __all__ = [
     '__author__',
     # Configuration
     'load_config',
+    'get_config',
+    'reload_config',
     'get_config_dir',
     'get_log_path',
     'APP_NAME',
@@ -53,6 +85,7 @@ __all__ = [
     'GPUMonitor',
     # Web scraping
     'FAHScraper',
+    'shutdown_browser',
     # Discord integration
     'DiscordRPC',
     # System tray
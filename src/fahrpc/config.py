@@ -20,9 +20,12 @@ Example usage:
     >>> print(get_config_dir())
 """
 
+import copy
+import functools
 import json
 import logging
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any, Dict, List, Optional, Tuple
 from platformdirs import user_config_dir
 import importlib.resources
@@ -39,15 +42,47 @@ APP_AUTHOR = "Bandokii"  # Author/organization name for directory structure
 logger = logging.getLogger(APP_NAME.upper())
 
 
+# ============================================================================
+# JSON Backend
+# ============================================================================
+# orjson (optional - pip install fahrpc[fast]) parses and serializes several
+# times faster than the stdlib json module. Falls back to json if missing.
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers only
+# need to catch the stdlib exception. Both backends work on UTF-8 bytes, so
+# config files are read and written in binary mode with no text layer.
+# A leading UTF-8 BOM (as some Windows editors write) is stripped first, since
+# the stdlib accepts it but orjson doesn't. Non-UTF-8 bytes raise
+# UnicodeDecodeError from the stdlib backend rather than JSONDecodeError.
+
+_UTF8_BOM = b"\xef\xbb\xbf"
+
+try:
+    import orjson
+
+    def _json_loads(data: bytes) -> Any:
+        return orjson.loads(data.removeprefix(_UTF8_BOM))
+
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _json_loads(data: bytes) -> Any:
+        return json.loads(data.removeprefix(_UTF8_BOM))
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode("utf-8")
+
+
 # ============================================================================
 # Path Resolution Functions
 # ============================================================================
 
+@functools.lru_cache(maxsize=1)
 def get_config_dir() -> Path:
     """
     Determine the config directory location:
     - If running from project root (pyproject.toml and config.json present), use project root.
     - Otherwise, use platformdirs user config directory.
+    The result is cached, so the filesystem is only probed on the first call.
     Returns:
         Path to the config directory (creates it if it doesn't exist)
     """
@@ -64,6 +99,7 @@ def get_config_dir() -> Path:
     return config_dir
 
 
+@functools.lru_cache(maxsize=1)
 def get_config_path() -> Path:
     """
     Get the full path to the config.json file.
@@ -97,12 +133,37 @@ def get_log_path(filename: str = "fah_error_log.txt") -> Path:
 def load_default_config() -> Dict[str, Any]:
     # Use importlib.resources to load default_config.json from the package
     try:
-        with importlib.resources.files("fahrpc.data").joinpath("default_config.json").open("r", encoding="utf-8") as f:
-            return json.load(f)
+        with importlib.resources.files("fahrpc.data").joinpath("default_config.json").open("rb") as f:
+            return _json_loads(f.read())
     except Exception as e:
         raise RuntimeError(f"Could not load default_config.json: {e}")
 
-DEFAULT_CONFIG = load_default_config()
+def _freeze(value: Any) -> Any:
+    """
+    Recursively convert dicts to read-only mappings and lists to tuples.
+
+    Args:
+        value: Parsed JSON value
+
+    Returns:
+        Immutable view of the value
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+# Mutable source of truth, private to this module. Merges and fallbacks copy
+# out of it so no loaded config shares objects with the defaults.
+_DEFAULT_CONFIG = load_default_config()
+
+# Public read-only view; mutation raises TypeError instead of silently
+# changing the defaults for every later load
+DEFAULT_CONFIG = _freeze(_DEFAULT_CONFIG)
+
+
 def diff_dicts(default: Dict[str, Any], user: Dict[str, Any]) -> Dict[str, Any]:
     """
     Recursively return only the keys in user that differ from default.
@@ -124,31 +185,78 @@ def diff_dicts(default: Dict[str, Any], user: Dict[str, Any]) -> Dict[str, Any]:
 # Configuration Helper Functions
 # ============================================================================
 
-def merge_dicts(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
+def apply_defaults(target: Dict[str, Any], defaults: Dict[str, Any]) -> Dict[str, Any]:
     """
-    Recursively merge two dictionaries.
+    Fill missing keys in a user config from defaults, in place.
 
     User config values override defaults, but missing keys fall back to defaults.
-    Nested dictionaries are merged recursively rather than replaced wholesale.
+    Nested dictionaries are merged rather than replaced wholesale. Only the
+    target is modified, so no intermediate dictionaries are copied, and the
+    walk uses an explicit stack instead of recursion. Default values filled
+    into the target are copied so the two never share mutable objects.
 
     Args:
-        base: Base dictionary (lower priority - defaults)
-        override: Override dictionary (higher priority - user config)
+        target: User config dictionary (higher priority - modified in place)
+        defaults: Default dictionary (lower priority - never modified)
 
     Returns:
-        Merged dictionary with all keys from both inputs
+        The target dictionary, now containing all keys from both inputs
+    """
+    stack = [(target, defaults)]
+    while stack:
+        target_node, default_node = stack.pop()
+        for key, value in default_node.items():
+            if isinstance(value, dict):
+                existing = target_node.setdefault(key, {})
+                if isinstance(existing, dict):
+                    stack.append((existing, value))
+            elif key not in target_node:
+                target_node[key] = copy.deepcopy(value)
+    return target
+
+# Required config keys as (dotted name, key path, accepted types) entries.
+# The table doubles as a lightweight schema: each path is resolved once and
+# its value type-checked, so a wrong type fails fast at startup instead of
+# surfacing later in the monitoring loop.
+_NUMBER = (int, float)
+
+REQUIRED_KEYS: Tuple[Tuple[str, Tuple[str, ...], Tuple[type, ...]], ...] = (
+    # pypresence accepts numeric client IDs as well as strings
+    ('discord.client_id', ('discord', 'client_id'), (str, int)),
+    ('foldingathome.web_url', ('foldingathome', 'web_url'), (str,)),
+    ('foldingathome.update_interval', ('foldingathome', 'update_interval'), _NUMBER),
+    ('temperature.thresholds', ('temperature', 'thresholds'), (dict,)),
+    ('temperature.thresholds.low', ('temperature', 'thresholds', 'low'), _NUMBER),
+    ('temperature.thresholds.medium', ('temperature', 'thresholds', 'medium'), _NUMBER),
+    ('hardware', ('hardware',), (dict,)),
+    ('logging.error_log_file', ('logging', 'error_log_file'), (str,)),
+)
+
+# Sentinel for a key path that doesn't resolve
+_MISSING = object()
+
+
+def _path_get(data: Any, path: Tuple[str, ...]) -> Any:
     """
-    result = base.copy()
-    for key, value in override.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = merge_dicts(result[key], value)
-        else:
-            result[key] = value
-    return result
+    Walk a key path through nested dictionaries.
+
+    Args:
+        data: Dictionary to walk
+        path: Keys to follow, outermost first
+
+    Returns:
+        The value at the path, or _MISSING if any step is absent
+    """
+    for key in path:
+        if not isinstance(data, dict) or key not in data:
+            return _MISSING
+        data = data[key]
+    return data
+
 
 def validate_config(config: Dict[str, Any]) -> Tuple[bool, List[str]]:
     """
-    Validate required config keys are present.
+    Validate required config keys are present and have the expected types.
 
     Args:
         config: Configuration dictionary to validate
@@ -156,23 +264,16 @@ def validate_config(config: Dict[str, Any]) -> Tuple[bool, List[str]]:
     Returns:
         Tuple of (is_valid, list_of_errors)
     """
-    required_keys = {
-        'discord.client_id': ['discord', 'client_id'],
-        'foldingathome.web_url': ['foldingathome', 'web_url'],
-        'temperature.thresholds': ['temperature', 'thresholds'],
-        'hardware': ['hardware'],
-        'logging.error_log_file': ['logging', 'error_log_file']
-    }
-
     errors = []
-    for key_name, key_path in required_keys.items():
-        value = config
-        try:
-            for path in key_path:
-                value = value[path]
-        except (KeyError, TypeError):
+    for key_name, key_path, types in REQUIRED_KEYS:
+        value = _path_get(config, key_path)
+        if value is _MISSING:
             errors.append(f"Missing required config key: {key_name}")
-
+        elif not isinstance(value, types) or isinstance(value, bool):
+            expected = " or ".join(t.__name__ for t in types)
+            errors.append(
+                f"Invalid type for config key: {key_name} (expected {expected}, got {type(value).__name__})"
+            )
     return len(errors) == 0, errors
 
 def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
@@ -180,6 +281,7 @@ def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
     Load configuration from JSON file with fallback to defaults.
 
     Creates default config file if it doesn't exist and validates on load.
+    The result becomes the process-wide config returned by get_config().
 
     Args:
         config_path: Path to config.json file (uses default location if None)
@@ -197,11 +299,11 @@ def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
     logger.debug(f"[CONFIG] Loading configuration from: {config_path}")
 
     try:
-        with open(config_path, 'r') as f:
+        with open(config_path, 'rb') as f:
             logger.debug("[CONFIG] Config file found, parsing JSON")
-            user_config = json.load(f)
+            user_config = _json_loads(f.read())
             logger.debug(f"[CONFIG] User config keys: {list(user_config.keys())}")
-            merged = merge_dicts(DEFAULT_CONFIG, user_config)
+            merged = apply_defaults(user_config, _DEFAULT_CONFIG)
             logger.debug("[CONFIG] Configuration merged successfully")
 
             # Validate configuration
@@ -218,7 +320,7 @@ def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
             logger.debug(f"[CONFIG] Update interval: {merged['foldingathome']['update_interval']}s")
             logger.debug(f"[CONFIG] Nvidia enabled: {merged['hardware']['nvidia']['enabled']}")
             logger.debug(f"[CONFIG] AMD enabled: {merged['hardware']['amd']['enabled']}")
-            return merged
+            return _cache_config(merged)
     except FileNotFoundError:
         logger.info(f"[CONFIG] Config file not found at {config_path}")
         logger.info("[CONFIG] Creating minimal configuration file")
@@ -226,17 +328,57 @@ def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
         # Ensure parent directory exists
         Path(config_path).parent.mkdir(parents=True, exist_ok=True)
         # Save an empty config file (user can fill in overrides)
-        with open(config_path, 'w') as f:
-            json.dump({}, f, indent=2)
+        with open(config_path, 'wb') as f:
+            f.write(_json_dumps({}))
             logger.info("[CONFIG] Empty configuration file written")
-        return DEFAULT_CONFIG
+        return _cache_config(copy.deepcopy(_DEFAULT_CONFIG))
 
-    except json.JSONDecodeError as e:
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
         logger.error(f"[CONFIG] JSON parsing error: {e}", exc_info=True)
         print(f"Error parsing config file: {e}")
         print("Using default configuration.")
         logger.info("[CONFIG] Falling back to default configuration")
-        return DEFAULT_CONFIG
+        return _cache_config(copy.deepcopy(_DEFAULT_CONFIG))
+
+
+# ============================================================================
+# Configuration Cache
+# ============================================================================
+# The parsed config is kept for the lifetime of the process so callers don't
+# re-read and re-validate config.json. reload_config() refreshes it (used on
+# restart from the tray menu).
+
+_CACHED_CONFIG: Optional[Dict[str, Any]] = None
+
+
+def _cache_config(config: Dict[str, Any]) -> Dict[str, Any]:
+    """Store config as the process-wide cached config and return it."""
+    global _CACHED_CONFIG
+    _CACHED_CONFIG = config
+    return config
+
+
+def get_config() -> Dict[str, Any]:
+    """
+    Get the cached configuration, loading it from disk on first use.
+
+    Returns:
+        Merged configuration dictionary
+    """
+    if _CACHED_CONFIG is None:
+        return load_config()
+    return _CACHED_CONFIG
+
+
+def reload_config() -> Dict[str, Any]:
+    """
+    Re-read config.json from disk and replace the cached configuration.
+
+    Returns:
+        Freshly loaded configuration dictionary
+    """
+    logger.info("[CONFIG] Reloading configuration from disk")
+    return load_config()
 
 def save_config(config: Dict[str, Any], config_path: Optional[str] = None) -> None:
     """
@@ -244,7 +386,7 @@ def save_config(config: Dict[str, Any], config_path: Optional[str] = None) -> No
     """
     if config_path is None:
         config_path = str(get_config_path())
-    diff = diff_dicts(DEFAULT_CONFIG, config)
+    diff = diff_dicts(_DEFAULT_CONFIG, config)
     Path(config_path).parent.mkdir(parents=True, exist_ok=True)
-    with open(config_path, "w") as f:
-        json.dump(diff, f, indent=2)
+    with open(config_path, "wb") as f:
+        f.write(_json_dumps(diff))
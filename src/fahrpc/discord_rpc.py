@@ -6,7 +6,7 @@ Manages Discord Rich Presence connection for displaying Folding@Home stats.
 
 Features:
     - Asynchronous connection management
-    - Automatic reconnection on disconnect
+    - Automatic reconnection on disconnect (with exponential backoff)
     - Elapsed time display (resets at midnight)
     - Customizable buttons (Start Folding, GitHub links)
     - Connection status tracking
@@ -24,7 +24,8 @@ Example usage:
 """
 
 import logging
-from datetime import datetime
+from datetime import date, datetime, time
+from time import monotonic
 from typing import Any, Dict, Optional
 
 from pypresence import AioPresence
@@ -33,6 +34,13 @@ from fahrpc.config import APP_NAME
 
 logger = logging.getLogger(APP_NAME.upper())
 
+# Reconnect backoff: the wait after a failed connect doubles up to the cap
+BACKOFF_INITIAL = 15.0  # seconds
+BACKOFF_MAX = 300.0     # seconds
+# Slack on the deadline check: a retry scheduled exactly one delay later can
+# wake a timer tick early (~15 ms on Windows) and must still count as due
+BACKOFF_TOLERANCE = 0.5  # seconds
+
 class DiscordRPC:
     """Manages Discord Rich Presence with connection status tracking."""
 
@@ -47,21 +55,40 @@ class DiscordRPC:
         self.rpc: Optional[AioPresence] = None
         self.connected: bool = False
 
+        # Local midnight as a Unix timestamp, recomputed when the date changes
+        self._midnight_date: Optional[date] = None
+        self._midnight_ts: int = 0
+
+        # Reconnect backoff state (monotonic deadline and current step)
+        self._backoff_until: float = 0.0
+        self._backoff_step: float = BACKOFF_INITIAL
+
     async def connect(self) -> bool:
         """
         Connect to Discord.
 
+        After a failed attempt, further calls return False without touching
+        the IPC pipe until the backoff delay has passed. The delay doubles on
+        each failure (15s, 30s, 60s... up to 5 minutes).
+
         Returns:
             True if connection successful, False otherwise
         """
+        if monotonic() + BACKOFF_TOLERANCE < self._backoff_until:
+            return False
+
         try:
             self.rpc = AioPresence(self.config['discord']['client_id'])
             await self.rpc.connect()
             self.connected = True
+            self._backoff_until = 0.0
+            self._backoff_step = BACKOFF_INITIAL
             return True
         except Exception:
             self.rpc = None
             self.connected = False
+            self._backoff_until = monotonic() + self._backoff_step
+            self._backoff_step = min(self._backoff_step * 2, BACKOFF_MAX)
             return False
 
     async def update(self, details: str, state: str) -> bool:
@@ -80,16 +107,17 @@ class DiscordRPC:
 
         try:
             # Use local time for the elapsed time display
-            # Calculate seconds since midnight (local time)
-            now = datetime.now()
-            midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
-            start_timestamp = int(midnight.timestamp())
+            # The elapsed timer counts from local midnight
+            today = date.today()
+            if today != self._midnight_date:
+                self._midnight_ts = int(datetime.combine(today, time.min).timestamp())
+                self._midnight_date = today
 
             await self.rpc.update(
                 details=details,
                 state=state,
                 large_image="folding-at-home-logo",
-                start=start_timestamp,
+                start=self._midnight_ts,
                 buttons=self.config['discord']['buttons']
             )
             return True
@@ -1,23 +1,22 @@
-# Cache project root in a global variable
+import functools
+import os
+from pathlib import Path
 
-# Sentinel object to distinguish between uninitialized and None
-_PROJECT_ROOT = None
 
 def get_project_root():
-    global _PROJECT_ROOT
-    if _PROJECT_ROOT is None:
-        result = find_project_root()
-        _PROJECT_ROOT = result if isinstance(result, Path) else None
-    return _PROJECT_ROOT
-import os
-import sys
-from pathlib import Path
+    """
+    Returns the cached project root (see find_project_root), or None.
+    """
+    return find_project_root()
 
 
+@functools.lru_cache(maxsize=1)
 def find_project_root():
     """
-    Returns the current working directory as project root if pyproject.toml exists and its project.name matches 'fahrpc'.
-    Returns None otherwise.
+    Returns the current working directory as project root if pyproject.toml exists and its
+    project.name matches 'fahrpc'. Returns None otherwise.
+
+    The result (including None) is cached for the lifetime of the process.
     """
     import tomllib
     cwd = Path(os.getcwd())
@@ -23,34 +23,174 @@ Example usage:
     ...     print(f"{name}: {util}% @ {temp}°C")
 """
 
+import asyncio
+import atexit
+import functools
 import logging
+import threading
+import time
 import warnings
-from typing import Any, Dict, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Tuple
 
 from fahrpc.config import APP_NAME
 
 logger = logging.getLogger(APP_NAME.upper())
 
+# Drivers only refresh sensor readings periodically; polling a vendor again
+# within these windows (seconds) returns the cached readings instead
+NVIDIA_MIN_POLL_INTERVAL = 0.05  # NVML updates every ~20-100 ms
+AMD_MIN_POLL_INTERVAL = 0.25     # ADL reads are slower to refresh
+
 # ============================================================================
 # GPU Library Imports
 # ============================================================================
 # Nvidia: pynvml wraps NVIDIA Management Library (NVML) for GPU monitoring
 # AMD: pyadl wraps AMD Display Library (ADL) for Radeon GPUs
-# Both libraries may emit warnings during import, which we suppress
+# Both load native driver libraries on import, so they are only imported on
+# first use, and only when the vendor is enabled in config.json
+
+pynvml = None           # Set by _import_pynvml()
+_nvml_inited = False    # True while NVML is initialized
+_nvml_lock = threading.Lock()
+ADLManager = None       # Set by _import_pyadl()
+_adl_manager = None     # ADLManager singleton, set by _get_adl_manager()
+AMD_SUPPORT = False     # True once pyadl imported successfully
+_adl_import_attempted = False
+
+# Errors an AMD sensor read can raise; ADLError is added once pyadl imports
+_ADL_READ_ERRORS: Tuple[type, ...] = (AttributeError, OSError)
+
+
+def _import_pynvml() -> Any:
+    """
+    Import the Nvidia NVML library on first use.
+
+    Returns:
+        The pynvml module
+
+    Raises:
+        ImportError: If nvidia-ml-py is not installed
+    """
+    global pynvml
+    if pynvml is None:
+        # Suppress FutureWarning from numpy/etc emitted during import
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore", category=FutureWarning)
+            import pynvml as _pynvml
+        pynvml = _pynvml
+    return pynvml
+
+
+def _init_nvml() -> None:
+    """
+    Import and initialize NVML once per process.
+
+    Later calls (another GPUMonitor, or a restart from the tray menu) return
+    immediately instead of re-initializing the driver library.
+
+    Raises:
+        ImportError: If nvidia-ml-py is not installed
+        pynvml.NVMLError: If NVML fails to initialize
+    """
+    global _nvml_inited
+    with _nvml_lock:
+        if not _nvml_inited:
+            _import_pynvml()
+            pynvml.nvmlInit()
+            _nvml_inited = True
+
+
+@functools.lru_cache(maxsize=1)
+def _nvml_devices() -> Tuple[Tuple[Any, str], ...]:
+    """
+    Enumerate Nvidia GPUs once per process.
+
+    Handles and names stay valid for as long as NVML is initialized, so
+    every GPUMonitor (including those created on restart) shares them
+    instead of re-querying the driver.
+
+    Returns:
+        Tuple of (handle, raw_device_name) pairs in NVML index order
+    """
+    _init_nvml()
+    devices = []
+    for i in range(pynvml.nvmlDeviceGetCount()):
+        handle = pynvml.nvmlDeviceGetHandleByIndex(i)
+        name = pynvml.nvmlDeviceGetName(handle)
+        if isinstance(name, bytes):
+            name = name.decode('utf-8')
+        devices.append((handle, name))
+    return tuple(devices)
+
+
+def _nvml_shutdown() -> None:
+    """
+    Shut down NVML if it is initialized.
+
+    Safe to call any number of times: only the first call after a
+    successful nvmlInit() does any work. Registered with atexit, so NVML is
+    released even when the application exits by another path.
+    """
+    global _nvml_inited
+    with _nvml_lock:
+        if not _nvml_inited:
+            return
+        _nvml_inited = False
+        _nvml_devices.cache_clear()  # Handles are invalid after shutdown
+        pynvml.nvmlShutdown()
+
+
+atexit.register(_nvml_shutdown)
+
+
+@functools.lru_cache(maxsize=1)
+def _nvml_pool() -> ThreadPoolExecutor:
+    """
+    Worker for Nvidia reads on mixed Nvidia/AMD systems, created once.
+
+    Shared by every GPUMonitor (including those created on restart), so
+    restarts don't leave idle worker threads behind.
+
+    Returns:
+        Single-worker executor
+    """
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix="fahrpc-nvml")
+
+
+def _import_pyadl() -> bool:
+    """
+    Import the AMD ADL library on first use (optional - graceful fallback).
 
-# Import Nvidia NVML library (suppress FutureWarning from numpy/etc)
-with warnings.catch_warnings():
-    warnings.filterwarnings("ignore", category=FutureWarning)
-    import pynvml
+    Returns:
+        True if AMD support is available
+    """
+    global ADLManager, AMD_SUPPORT, _adl_import_attempted, _ADL_READ_ERRORS
+    if not _adl_import_attempted:
+        _adl_import_attempted = True
+        try:
+            from pyadl import ADLError
+            from pyadl import ADLManager as _ADLManager
+            ADLManager = _ADLManager
+            _ADL_READ_ERRORS = (ADLError, AttributeError, OSError)
+            AMD_SUPPORT = True
+        except (ImportError, Exception) as e:
+            # AMD support requires specific drivers and pyadl package
+            logger.debug(f"AMD GPU support not available: {e}")
+    return AMD_SUPPORT
 
-# Import AMD ADL library (optional - graceful fallback if not available)
-try:
-    from pyadl import ADLManager
-    AMD_SUPPORT = True
-except (ImportError, Exception) as e:
-    # AMD support requires specific drivers and pyadl package
-    logger.debug(f"AMD GPU support not available: {e}")
-    AMD_SUPPORT = False
+
+def _get_adl_manager() -> Any:
+    """
+    Get the ADLManager instance, fetching it only on the first call.
+
+    Returns:
+        The ADLManager singleton (None if ADL returned no instance)
+    """
+    global _adl_manager
+    if _adl_manager is None:
+        _adl_manager = ADLManager.getInstance()
+    return _adl_manager
 
 
 # ============================================================================
@@ -63,9 +203,10 @@ class GPUMonitor:
 
     Attributes:
         config: Configuration dictionary
-        nvidia_handles: List of (handle, name) tuples for Nvidia GPUs
-        nvidia_names: List of cleaned Nvidia GPU names
+        nvidia_handles: List of NVML device handles for Nvidia GPUs
+        nvidia_names: List of cleaned Nvidia GPU names (parallel to nvidia_handles)
         amd_devices: List of AMD device objects from ADLManager
+        amd_names: List of cleaned AMD GPU names (parallel to amd_devices)
     """
 
     def __init__(self, config: Dict[str, Any]) -> None:
@@ -78,124 +219,211 @@ class GPUMonitor:
         self.config = config
         self.nvidia_handles = []
         self.nvidia_names = []
+        self._nvidia_sample_ts = []  # Last utilization sample timestamp per handle
         self.amd_devices = []
+        self.amd_names = []
+        self._amd_readers = []  # (getCurrentUsage, getCurrentTemperature) per AMD device
         self._detect_hardware()
 
+        # Last readings per vendor and when they were taken (monotonic)
+        self._nvidia_cache: List[Tuple[str, int, int]] = []
+        self._nvidia_polled_at = float('-inf')
+        self._amd_cache: List[Tuple[str, int, Any]] = []
+        self._amd_polled_at = float('-inf')
+
+        # Mixed Nvidia/AMD systems read the vendors concurrently (see get_all_gpu_data)
+        self._pool = None
+        if self.nvidia_handles and self.amd_devices:
+            self._pool = _nvml_pool()
+
     def _detect_hardware(self) -> None:
         """Detect available GPUs (Nvidia and AMD) with sanity checks and extra logging."""
         # Nvidia detection
         if self.config['hardware']['nvidia']['enabled']:
             try:
-                pynvml.nvmlInit()
-                device_count = pynvml.nvmlDeviceGetCount()
-                for i in range(device_count):
-                    handle = pynvml.nvmlDeviceGetHandleByIndex(i)
-                    name = pynvml.nvmlDeviceGetName(handle)
-                    if isinstance(name, bytes):
-                        name = name.decode('utf-8')
-                    clean_name = name.replace(
-                        self.config['hardware']['nvidia']['strip_prefix'], ""
-                    ).strip()
-                    self.nvidia_handles.append((handle, clean_name))
+                strip_prefix = self.config['hardware']['nvidia']['strip_prefix']
+                for handle, name in _nvml_devices():
+                    # Names are cleaned once here, never in the polling path
+                    clean_name = name.replace(strip_prefix, "").strip()
+                    self.nvidia_handles.append(handle)
                     self.nvidia_names.append(clean_name)
+                    self._nvidia_sample_ts.append(0)
             except Exception as e:
                 logger.error(f"Nvidia GPU detection failed: {e}", exc_info=True)
 
         # AMD detection with sanity check and extra logging
-        if self.config['hardware']['amd']['enabled'] and AMD_SUPPORT:
+        if self.config['hardware']['amd']['enabled'] and _import_pyadl():
             try:
-                instance = ADLManager.getInstance()
+                instance = _get_adl_manager()
                 if instance:
                     raw_devices = instance.getDevices()
                     valid_devices = []
+                    valid_names = []
+                    debug_enabled = logger.isEnabledFor(logging.DEBUG)
                     for dev in raw_devices:
                         # Log all detected device details for debugging
-                        logger.debug(
-                            f"[AMD DETECT] Device: adapterName={getattr(dev, 'adapterName', None)}, "
-                            f"present={getattr(dev, 'present', None)}, "
-                            f"busNumber={getattr(dev, 'busNumber', None)}"
-                        )
+                        if debug_enabled:
+                            logger.debug(
+                                f"[AMD DETECT] Device: adapterName={getattr(dev, 'adapterName', None)}, "
+                                f"present={getattr(dev, 'present', None)}, "
+                                f"busNumber={getattr(dev, 'busNumber', None)}"
+                            )
                         # Sanity check: Only keep devices with a valid, non-empty adapterName
                         # and present==True if available
                         name = getattr(dev, 'adapterName', None)
                         present = getattr(dev, 'present', True)  # Some ADL versions have 'present' attribute
-                        if name and isinstance(name, str) and name.strip() and present:
+                        # pyadl exposes adapterName as bytes (a C char array); normalize once here
+                        if isinstance(name, bytes):
+                            name = name.decode('utf-8', errors='replace')
+                        name = name.strip() if isinstance(name, str) else ""
+                        if name and present:
                             valid_devices.append(dev)
+                            valid_names.append(name)
                         else:
                             logger.warning(
                                 f"[AMD DETECT] Ignoring invalid or ghost device: adapterName={name}, present={present}"
                             )
                     self.amd_devices = valid_devices
+                    # Names are cleaned once here, never in the polling path
+                    strip_prefix = self.config['hardware']['amd']['strip_prefix']
+                    self.amd_names = [name.replace(strip_prefix, "").strip() for name in valid_names]
+                    # Bound methods, so polling skips the attribute lookups
+                    self._amd_readers = [
+                        (dev.getCurrentUsage, dev.getCurrentTemperature) for dev in valid_devices
+                    ]
                     logger.info(
                         f"[AMD DETECT] {len(self.amd_devices)} valid AMD device(s) detected after filtering."
                     )
             except Exception as e:
                 logger.error(f"AMD GPU detection failed: {e}", exc_info=True)
                 self.amd_devices = []
+                self.amd_names = []
+                self._amd_readers = []
+
+    def _iter_nvidia_data(self) -> Iterator[Tuple[str, int, int]]:
+        """Yield (gpu_name, utilization_percent, temperature_celsius) per Nvidia GPU."""
+        # Two point queries per GPU are the minimum: NVML's batched
+        # nvmlDeviceGetFieldValues has no field IDs for core temperature or
+        # GPU utilization, so they can't be folded into one call
+        if not self.nvidia_handles:
+            return  # pynvml may not even be imported
+        # Bind the per-GPU lookups once instead of on every iteration
+        get_temperature = pynvml.nvmlDeviceGetTemperature
+        temperature_sensor = pynvml.NVML_TEMPERATURE_GPU
+        nvml_error = pynvml.NVMLError
+        read_util = self._read_nvidia_util
+        for index, (handle, name) in enumerate(zip(self.nvidia_handles, self.nvidia_names)):
+            try:
+                temp = get_temperature(handle, temperature_sensor)
+                util = read_util(index, handle)
+                yield name, util, temp
+            except nvml_error as e:
+                logger.debug(f"Failed to get Nvidia GPU data for {name}: {e}")
+
+    def _read_nvidia_util(self, index: int, handle: Any) -> int:
+        """
+        Read average GPU utilization since the previous read.
+
+        NVML samples utilization internally many times per second, so one
+        nvmlDeviceGetSamples call returns every sample taken since the last
+        tick. Averaging them gives a reading for the whole update interval
+        rather than a single short window at the moment of polling.
+
+        Args:
+            index: Position of the handle in nvidia_handles
+            handle: NVML device handle
+
+        Returns:
+            Utilization percentage
+        """
+        try:
+            _, samples = pynvml.nvmlDeviceGetSamples(
+                handle, pynvml.NVML_GPU_UTILIZATION_SAMPLES, self._nvidia_sample_ts[index]
+            )
+        except pynvml.NVMLError:
+            # No new samples yet, or sampling unsupported on this GPU
+            samples = None
+        if not samples:
+            return pynvml.nvmlDeviceGetUtilizationRates(handle).gpu
+        self._nvidia_sample_ts[index] = max(sample.timeStamp for sample in samples)
+        return round(sum(sample.sampleValue.uiVal for sample in samples) / len(samples))
+
+    def _iter_amd_data(self) -> Iterator[Tuple[str, int, Any]]:
+        """Yield (gpu_name, utilization_percent, temperature) per AMD GPU."""
+        if not AMD_SUPPORT:
+            return
+        for name, (get_usage, get_temperature) in zip(self.amd_names, self._amd_readers):
+            try:
+                util = get_usage()
+                temp = get_temperature()
+                if temp is None or temp <= 0:
+                    temp = "N/A"
+                yield name, util, temp
+            except _ADL_READ_ERRORS as e:
+                logger.debug(f"Failed to get AMD GPU data for {name}: {e}")
 
     def get_nvidia_data(self) -> List[Tuple[str, int, int]]:
         """
         Get current Nvidia GPU data.
 
+        Calls within NVIDIA_MIN_POLL_INTERVAL of the last read return the
+        cached readings, since NVML would not have new values yet.
+
         Returns:
             List of tuples: (gpu_name, utilization_percent, temperature_celsius)
         """
-        data = []
-        for handle, name in self.nvidia_handles:
-            try:
-                temp = pynvml.nvmlDeviceGetTemperature(handle, pynvml.NVML_TEMPERATURE_GPU)
-                util = pynvml.nvmlDeviceGetUtilizationRates(handle).gpu
-                data.append((name, util, temp))
-            except Exception as e:
-                logger.error(f"Failed to get Nvidia GPU data for {name}: {e}", exc_info=True)
-        return data
+        now = time.monotonic()
+        if now - self._nvidia_polled_at >= NVIDIA_MIN_POLL_INTERVAL:
+            self._nvidia_cache = list(self._iter_nvidia_data())
+            self._nvidia_polled_at = now
+        return self._nvidia_cache
 
     def get_amd_data(self) -> List[Tuple[str, int, Any]]:
         """
         Get current AMD GPU data.
 
+        Calls within AMD_MIN_POLL_INTERVAL of the last read return the
+        cached readings.
+
         Returns:
             List of tuples: (gpu_name, utilization_percent, temperature)
         """
-        data = []
-        if AMD_SUPPORT:
-            for dev in self.amd_devices:
-                try:
-                    name = dev.adapterName.replace(
-                        self.config['hardware']['amd']['strip_prefix'], ""
-                    ).strip()
-                    util = dev.getCurrentUsage()
-                    temp = dev.getCurrentTemperature()
-                    if temp is None or temp <= 0:
-                        temp = "N/A"
-                    data.append((name, util, temp))
-                except Exception as e:
-                    logger.error(f"Failed to get AMD GPU data: {e}", exc_info=True)
-        return data
-
-    def get_all_gpu_data(self) -> Tuple[List, List[int], List[int]]:
+        now = time.monotonic()
+        if now - self._amd_polled_at >= AMD_MIN_POLL_INTERVAL:
+            self._amd_cache = list(self._iter_amd_data())
+            self._amd_polled_at = now
+        return self._amd_cache
+
+    def get_all_gpu_data(self) -> List[Tuple[str, int, Any]]:
         """
-        Get data from all GPUs.
+        Get data from all GPUs (Nvidia first, then AMD).
+
+        With both vendors present, the Nvidia reads run on a worker thread
+        while the AMD reads run on this one. NVML and ADL release the GIL
+        inside their driver calls, so a sweep takes as long as the slower
+        vendor rather than both combined.
 
         Returns:
-            Tuple of (gpu_lines, utilizations, temperatures)
+            List of tuples: (gpu_name, utilization_percent, temperature).
+            AMD temperatures may be "N/A".
+        """
+        if self._pool is not None:
+            nvidia_future = self._pool.submit(self.get_nvidia_data)
+            amd_data = self.get_amd_data()
+            return nvidia_future.result() + amd_data
+        return self.get_nvidia_data() + self.get_amd_data()
+
+    async def get_all_gpu_data_async(self) -> List[Tuple[str, int, Any]]:
+        """
+        Get data from all GPUs without blocking the event loop.
+
+        NVML and ADL reads are synchronous driver calls (ADL reads can take
+        tens of milliseconds each), so they run in a worker thread.
+
+        Returns:
+            List of tuples: (gpu_name, utilization_percent, temperature)
         """
-        gpu_lines = []
-        utilizations = []
-        temperatures = []
-
-        # Nvidia GPUs
-        for name, util, temp in self.get_nvidia_data():
-            utilizations.append(util)
-            temperatures.append(temp)
-            gpu_lines.append((name, util, temp))
-        # AMD GPUs
-        for name, util, temp in self.get_amd_data():
-            utilizations.append(util)
-            if temp != "N/A":
-                temperatures.append(temp)
-            gpu_lines.append((name, util, temp))
-        return gpu_lines, utilizations, temperatures
+        return await asyncio.to_thread(self.get_all_gpu_data)
 
     @property
     def nvidia_count(self) -> int:
@@ -209,8 +437,8 @@ class GPUMonitor:
 
     @staticmethod
     def shutdown() -> None:
-        """Clean up GPU monitoring resources."""
+        """Clean up GPU monitoring resources (no-op if already shut down)."""
         try:
-            pynvml.nvmlShutdown()
+            _nvml_shutdown()
         except Exception as e:
             logger.error(f"Error during GPU monitor shutdown: {e}", exc_info=True)
@@ -11,6 +11,7 @@ Features:
     - Log level indicators (DEBUG, INFO, WARNING, ERROR, CRITICAL)
     - Full exception stack traces for error debugging
     - Rotating file handler (10MB max, 5 backups)
+    - Background writer thread (logging calls only enqueue records)
     - Asyncio warning suppression (configurable)
     - stderr redirection with timestamps
 
@@ -26,14 +27,47 @@ Example usage:
     >>> logger.error("Something went wrong", exc_info=True)
 """
 
+import atexit
+import copy
 import logging
+import queue
+import re
 import sys
 import time
 import traceback
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Optional
 
 from fahrpc.config import APP_NAME
 
+__all__ = ["setup_error_logging"]
+
+# Logger returned by the first setup_error_logging() call
+_configured_logger: Optional[logging.Logger] = None
+
+# (unix second, formatted timestamp) of the last timestamp built
+_TS_CACHE = (0, "")
+
+
+def format_log_timestamp(created: float) -> str:
+    """
+    Format a Unix time as "[YYYY-MM-DD HH:MM:SS]".
+
+    The result is cached per whole second, so a burst of log lines only
+    calls strftime once.
+
+    Args:
+        created: Unix timestamp (e.g. LogRecord.created or time.time())
+
+    Returns:
+        Bracketed local timestamp string
+    """
+    global _TS_CACHE
+    second = int(created)
+    if _TS_CACHE[0] != second:
+        _TS_CACHE = (second, time.strftime('[%Y-%m-%d %H:%M:%S]', time.localtime(second)))
+    return _TS_CACHE[1]
+
 
 class ModuleContextFormatter(logging.Formatter):
     """Custom formatter that includes module context and enhanced error details."""
@@ -47,7 +81,7 @@ class ModuleContextFormatter(logging.Formatter):
         line_number = record.lineno
 
         # Format timestamp
-        timestamp = time.strftime('[%Y-%m-%d %H:%M:%S]', time.localtime(record.created))
+        timestamp = format_log_timestamp(record.created)
 
         # Build base message
         level_name = record.levelname
@@ -63,9 +97,13 @@ class ModuleContextFormatter(logging.Formatter):
         if record.exc_info:
             exc_type, exc_value, exc_tb = record.exc_info
             if exc_tb:
+                # Cache the rendered stack on the record (as logging.Formatter
+                # does), so a record sent to several handlers is walked once
+                if not record.exc_text:
+                    record.exc_text = "".join(traceback.format_tb(exc_tb))
                 log_line += f"\n[EXCEPTION] {exc_type.__name__}: {exc_value}"
                 log_line += "\n[STACK TRACE]:\n"
-                log_line += "".join(traceback.format_tb(exc_tb))
+                log_line += record.exc_text
 
         return log_line
 
@@ -91,12 +129,14 @@ class TimestampedFileWriter:
             "__del__",
             "_sock.fileno()"
         ]
+        # One alternation scans the text once instead of once per keyword
+        self._suppress_re = re.compile("|".join(map(re.escape, self.suppress_keywords)))
 
     def write(self, text: str) -> None:
         if text:
             # Check if we should suppress this text
             if self.suppress_warnings:
-                if any(keyword in text for keyword in self.suppress_keywords):
+                if self._suppress_re.search(text):
                     self.suppressing = True
                     self.suppress_lines_remaining = 15
                     return
@@ -107,26 +147,41 @@ class TimestampedFileWriter:
                         self.suppressing = False
                     return
 
-            # Write with timestamps
-            lines = text.split('\n')
-            for i, line in enumerate(lines):
-                if line or (i < len(lines) - 1):
-                    if self.at_line_start and line:
-                        timestamp = time.strftime('[%Y-%m-%d %H:%M:%S] ')
-                        self.file.write(timestamp + line)
-                        self.at_line_start = False
-                    else:
-                        self.file.write(line)
-
-                    if i < len(lines) - 1:
-                        self.file.write('\n')
-                        self.at_line_start = True
-            self.file.flush()
+            # Write with timestamps, collected into a single writelines() call.
+            # All lines in one write share a timestamp, formatted at most once.
+            out = []
+            timestamp = None
+            for line in text.splitlines(keepends=True):
+                if self.at_line_start and line[0] not in '\r\n':
+                    if timestamp is None:
+                        timestamp = format_log_timestamp(time.time()) + ' '
+                    out.append(timestamp)
+                out.append(line)
+                self.at_line_start = line[-1] in '\r\n'
+            self.file.writelines(out)
 
     def flush(self) -> None:
         """Flush the file buffer."""
         self.file.flush()
 
+class RecordQueueHandler(QueueHandler):
+    """
+    QueueHandler for a listener in the same process.
+
+    The stock QueueHandler pre-formats records and drops exc_info so they
+    can be pickled. Records here never leave the process, so only the
+    message is resolved, and the traceback is left for ModuleContextFormatter
+    to render on the listener thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Snapshot the message so later changes to its args aren't logged."""
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
 def setup_error_logging(log_file: str, suppress_warnings: bool = True) -> logging.Logger:
     """
     Set up enhanced error logging with module context, timestamps, and stack traces.
@@ -139,6 +194,11 @@ def setup_error_logging(log_file: str, suppress_warnings: bool = True) -> loggin
     - Rotating file handler (10MB per file, keeps 5 backups)
     - Separate stderr capture with timestamps
     - Asyncio warning suppression (optional)
+    - File writes and formatting on a listener thread, so logging calls
+      from the event loop only pay for an enqueue
+
+    Only the first call configures anything; later calls return the same
+    logger, so stderr is wrapped once and no handler is added twice.
 
     Args:
         log_file: Path to the log file
@@ -147,9 +207,14 @@ def setup_error_logging(log_file: str, suppress_warnings: bool = True) -> loggin
     Returns:
         Configured logger instance
     """
+    global _configured_logger
+    if _configured_logger is not None:
+        return _configured_logger
+
     # Capture stderr with timestamps
     # Note: File handle is stored in TimestampedFileWriter for proper lifecycle management
-    stderr_file = open(log_file, "a")
+    # Line-buffered, so each complete line reaches the file without a flush per write
+    stderr_file = open(log_file, "a", buffering=1)
     sys.stderr = TimestampedFileWriter(
         stderr_file,
         suppress_warnings=suppress_warnings
@@ -166,13 +231,18 @@ def setup_error_logging(log_file: str, suppress_warnings: bool = True) -> loggin
     # Apply custom formatter with module context and stack traces
     formatter = ModuleContextFormatter()
     handler.setFormatter(formatter)
-    logger.addHandler(handler)
 
     # Also add a console handler for critical errors
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.CRITICAL)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+
+    # Both handlers run on the listener thread; the logger only enqueues
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, handler, console_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)  # Drains queued records before exit
+    logger.addHandler(RecordQueueHandler(log_queue))
 
     # Log startup message with metadata
     logger.info("=" * 80)
@@ -183,4 +253,5 @@ def setup_error_logging(log_file: str, suppress_warnings: bool = True) -> loggin
     logger.debug("Log level: DEBUG (all messages captured)")
     logger.info("=" * 80)
 
+    _configured_logger = logger
     return logger
@@ -31,22 +31,21 @@ Command Line:
 
 import asyncio
 import logging
-import os
-import re
 import signal
 import sys
 import threading
 import time
-from typing import Any, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+# Only the light config/logging parts are imported here. The GPU, scraper,
+# Discord and tray classes are resolved where they are first needed, so
+# logging is up before Playwright/NVML/pystray load and the tray appears
+# without waiting on the scraper stack.
 from fahrpc import (
-    DiscordRPC,
-    FAHScraper,
-    GPUMonitor,
-    TrayIcon,
+    get_config,
     get_log_path,
     load_config,
-    set_console_visibility,
+    reload_config,
     setup_error_logging,
 )
 
@@ -56,8 +55,73 @@ from fahrpc import (
 # Threading events for coordinating shutdown and restart between
 # the main async loop and the system tray icon thread
 
-restart_event = threading.Event()  # Set by tray menu to trigger restart
-stop_event = threading.Event()     # Set by tray menu or signal to trigger shutdown
+
+class LoopEvent(threading.Event):
+    """
+    threading.Event that asyncio code can also await without polling.
+
+    set() may be called from any thread (tray menu, signal handler); waiting
+    coroutines are woken through their loop's call_soon_threadsafe.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._waiters: set = set()  # (loop, future) pairs
+        # Re-entrant: set() may run from a signal handler on the loop thread
+        self._waiters_lock = threading.RLock()
+
+    def set(self) -> None:
+        """Set the flag and wake every coroutine awaiting wait_async()."""
+        super().set()
+        with self._waiters_lock:
+            waiters = list(self._waiters)
+        for loop, future in waiters:
+            try:
+                loop.call_soon_threadsafe(_resolve_future, future)
+            except RuntimeError:
+                pass  # Loop already closed
+
+    async def wait_async(self) -> None:
+        """Wait until the flag is set without blocking the event loop."""
+        if self.is_set():
+            return
+        loop = asyncio.get_running_loop()
+        waiter = (loop, loop.create_future())
+        with self._waiters_lock:
+            self._waiters.add(waiter)
+        try:
+            # Re-check after registering so a concurrent set() isn't missed
+            if not self.is_set():
+                await waiter[1]
+        finally:
+            with self._waiters_lock:
+                self._waiters.discard(waiter)
+
+
+def _resolve_future(future: asyncio.Future) -> None:
+    """Mark a LoopEvent waiter future as done (runs on its event loop)."""
+    if not future.done():
+        future.set_result(None)
+
+
+async def wait_for_any(*events: LoopEvent) -> None:
+    """
+    Wait until at least one of the given events is set.
+
+    Args:
+        events: LoopEvent instances to wait on
+    """
+    waiters = [asyncio.create_task(event.wait_async()) for event in events]
+    try:
+        await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        for waiter in waiters:
+            waiter.cancel()
+        await asyncio.gather(*waiters, return_exceptions=True)
+
+
+restart_event = LoopEvent()  # Set by tray menu to trigger restart
+stop_event = LoopEvent()     # Set by tray menu or signal to trigger shutdown
 
 # Logger instance (initialized in main())
 logger: Optional[logging.Logger] = None
@@ -81,8 +145,84 @@ COLORS = {
     "orange": "\033[38;5;208m",  # 256-color orange
 }
 
-# Regex to strip ANSI codes for length calculations
-RE_ANSI = re.compile(r'\033\[[0-9;]*m')
+# Win32 console constants for enabling ANSI escape processing
+STD_OUTPUT_HANDLE = -11
+ENABLE_VIRTUAL_TERMINAL_PROCESSING = 0x0004
+
+# Timestamp wrapper fragments and per-second cache: (epoch_second, formatted)
+# Many lines are printed back-to-back within one tick, so the formatted
+# timestamp is only rebuilt when the wall-clock second changes.
+TS_PREFIX = f"{COLORS['white']}["
+TS_SUFFIX = f"]{COLORS['reset']}"
+_TS_CACHE = (0, "")
+
+# ============================================================================
+# Precomputed Console Messages
+# ============================================================================
+# Static ANSI-wrapped fragments are built once at import. Templates only
+# leave the variable fields ({ts}, counts, values) to be filled per call.
+
+FAHRPC_LABEL = f"{COLORS['red']}FAH{COLORS['blue']}RPC{COLORS['reset']}"
+
+# Visible width of "[HH:MM:SS]" is fixed, so continuation-line padding is too
+TS_VISIBLE_LEN = len("[HH:MM:SS]")
+PADDING_STR = " " * (TS_VISIBLE_LEN + 1 + len("FAHRPC -") + 1)
+
+MSG_INIT_HARDWARE = f" {{ts}} {COLORS['white']}[*] Initializing Hardware Monitor...{COLORS['reset']}"
+MSG_LAUNCH_SCRAPER = f" {{ts}} {COLORS['white']}[*] Launching Web Scraper engine...{COLORS['reset']}"
+MSG_SCRAPER_READY = f" {{ts}} {COLORS['green']}[OK] Scraper engine ready.{COLORS['reset']}"
+MSG_DISCORD_CONNECTING = f" {{ts}} {COLORS['white']}[*] Attempting Discord connection...{COLORS['reset']}"
+MSG_DISCORD_OK = f" {{ts}} {COLORS['green']}[OK] Discord connection stable.{COLORS['reset']}"
+MSG_DISCORD_NOT_FOUND = f" {{ts}} {COLORS['red']}[!] Discord not found.{COLORS['reset']}"
+MSG_RETRYING = f"{HARDWARE_PADDING}└─ Retrying...{COLORS['reset']}"
+MSG_RETRYING_CONNECTION = f"{HARDWARE_PADDING}└─ Retrying connection...{COLORS['reset']}"
+MSG_RETRYING_EVERY = f"{HARDWARE_PADDING}└─ Retrying every {{interval}} seconds...{COLORS['reset']}"
+MSG_FAH_LOST = f" {{ts}} {COLORS['red']}[!] FAH connection lost: {{error}}...{COLORS['reset']}"
+MSG_FAH_RESTORED = f" {{ts}} {COLORS['green']}[OK] FAH connection restored.{COLORS['reset']}"
+MSG_FOLDING_STARTED = f" {{ts}} {COLORS['green']}[+] Folding has started/resumed.{COLORS['reset']}"
+MSG_FOLDING_PAUSED = f" {{ts}} {COLORS['yellow']}[!] Folding is currently paused.{COLORS['reset']}"
+MSG_STATSYNC = f" {{ts}} {COLORS['white']}[+] StatSync...{COLORS['reset']}"
+MSG_STATSYNC_OK = (
+    f" {{ts}} {COLORS['green']}[OK] StatSync: {COLORS['white']}{{points}} pts │ {{wus}} WUs{COLORS['reset']}"
+)
+MSG_STATUS_LINE = f" {{ts}} {FAHRPC_LABEL} - {{body}}"
+
+# Project detail lines: "Project │ <id> - <pct>%", continuation lines are
+# indented to line up under the first one
+PROJ_LINE_HEAD = f"{COLORS['white']}Project{COLORS['reset']} │ "
+PCT_WRAP = (f" - {COLORS['yellow']}", f"%{COLORS['reset']}")
+PROJ_LINE_SEP = "\n" + " " * 21
+MSG_SHUTTING_DOWN = f"\n {{ts}} {COLORS['yellow']}[*] Shutting down gracefully...{COLORS['reset']}"
+MSG_DISCORD_CLOSED = f" {{ts}} {COLORS['green']}[OK] Discord connection closed.{COLORS['reset']}"
+MSG_SCRAPER_CLOSED = f" {{ts}} {COLORS['green']}[OK] Scraper engine closed.{COLORS['reset']}"
+MSG_SHUTDOWN_COMPLETE = f" {{ts}} {COLORS['green']}[OK] Shutdown complete.{COLORS['reset']}"
+MSG_RESTARTING = f"\n {{ts}} {COLORS['yellow']}[*] Restarting logic...{COLORS['reset']}"
+
+# ============================================================================
+# Discord Presence Cycle Table
+# ============================================================================
+# Indexed by min(num_projects, 2); each entry is the rotation of presence
+# slots for that case. Every slot takes
+# (proj_ids, percents, global_points, global_wus, rpc_gpu_text)
+# and returns (detail_text, state_text).
+
+CYCLE_TABLE = (
+    # No projects: global stats only
+    (
+        lambda ids, pcts, pts, wus, gpu: (f"pTotal: {pts}", f"WUs Completed: {wus}"),
+    ),
+    # One project: global stats, then GPU info with the project
+    (
+        lambda ids, pcts, pts, wus, gpu: (f"pTotal: {pts}", f"WUs Completed: {wus}"),
+        lambda ids, pcts, pts, wus, gpu: (gpu, f"Project {ids[0]} - {pcts[0]}%"),
+    ),
+    # Two or more projects: global stats, first two projects, GPU info
+    (
+        lambda ids, pcts, pts, wus, gpu: (f"pTotal: {pts}", f"WUs Completed: {wus}"),
+        lambda ids, pcts, pts, wus, gpu: (f"Project {ids[0]} - {pcts[0]}%", f"Project {ids[1]} - {pcts[1]}%"),
+        lambda ids, pcts, pts, wus, gpu: (gpu, '"hyper modern space heater"'),
+    ),
+)
 
 
 # ============================================================================
@@ -96,51 +236,95 @@ def get_timestamp() -> str:
     Returns:
         Formatted timestamp like "[HH:MM:SS]" with ANSI colors
     """
-    return f"{COLORS['white']}[{time.strftime('%H:%M:%S')}]{COLORS['reset']}"
+    global _TS_CACHE
+    now = int(time.time())
+    if _TS_CACHE[0] != now:
+        _TS_CACHE = (now, TS_PREFIX + time.strftime('%H:%M:%S', time.localtime(now)) + TS_SUFFIX)
+    return _TS_CACHE[1]
 
 
-def strip_ansi(text: str) -> str:
+def enable_ansi_colors() -> None:
     """
-    Removes ANSI escape codes to calculate visible string length.
-
-    Args:
-        text: String containing ANSI codes
+    Enables ANSI escape processing on the Windows console.
 
-    Returns:
-        String without ANSI codes
+    Sets ENABLE_VIRTUAL_TERMINAL_PROCESSING on the stdout handle directly
+    rather than spawning cmd.exe via os.system('color'). No-op elsewhere.
     """
-    return RE_ANSI.sub('', text)
+    if sys.platform != "win32":
+        return
+    import ctypes
+
+    kernel32 = ctypes.windll.kernel32
+    handle = kernel32.GetStdHandle(STD_OUTPUT_HANDLE)
+    mode = ctypes.c_ulong()
+    if kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+        kernel32.SetConsoleMode(handle, mode.value | ENABLE_VIRTUAL_TERMINAL_PROCESSING)
 
-def get_temp_color(temp: Any, config: dict) -> str:
+
+def make_temp_color(config: dict) -> Callable[[Any], str]:
     """
-    Returns the ANSI color code based on temperature thresholds.
+    Builds a temperature-to-color lookup from the configured thresholds.
+
+    Thresholds and ANSI codes are resolved once here into a table indexed
+    by whole degrees (0-255), so each call is a single list lookup.
 
     Args:
-        temp: Temperature value or "N/A"
         config: Configuration dictionary
 
     Returns:
-        ANSI color code string
+        Function mapping a temperature value (or "N/A") to an ANSI color code
     """
-    if temp == "N/A":
-        return COLORS['white']
-
     thresholds = config['temperature']['thresholds']
     color_names = config['temperature']['colors']
+    low, medium = thresholds['low'], thresholds['medium']
+    cool = COLORS[color_names['low']]       # Green: cool
+    warm = COLORS[color_names['medium']]    # Orange: warm
+    hot = COLORS[color_names['high']]       # Red: hot
+    unknown = COLORS['white']
+    table = [cool if t < low else warm if t < medium else hot for t in range(256)]
 
-    # Return color based on temperature thresholds from config
-    if temp < thresholds['low']:
-        return COLORS[color_names['low']]      # Green: cool
-    elif temp < thresholds['medium']:
-        return COLORS[color_names['medium']]   # Orange: warm
-    else:
-        return COLORS[color_names['high']]     # Red: hot
+    def get_temp_color(temp: Any) -> str:
+        if temp == "N/A":
+            return unknown
+        return table[min(max(int(temp), 0), 255)]
+
+    return get_temp_color
 
 
 # ============================================================================
 # Console Output Functions
 # ============================================================================
 
+def write_console(parts: List[str]) -> None:
+    """
+    Writes accumulated console lines with a single stdout write and flush.
+
+    Args:
+        parts: Lines to write (cleared after writing)
+    """
+    if parts:
+        sys.stdout.write("\n".join(parts) + "\n")
+        sys.stdout.flush()
+        parts.clear()
+
+
+# ASCII art - "FAH" in red, "RPC" in blue (two-tone FAH | RPC effect)
+_RED, _BLUE = COLORS['red'], COLORS['blue']
+HEADER_LINES = (
+    rf"     {_RED}______  ___   _   _{_BLUE}  ______ ______  _____          ",
+    rf"     {_RED}|  ___|/ _ \ | | | |{_BLUE} | ___ \| ___ \/  __ \         ",
+    rf"     {_RED}| |_  / /_\ \| |_| |{_BLUE} | |_/ /| |_/ /| /  \/         ",
+    rf"     {_RED}|  _| |  _  ||  _  |{_BLUE} |    / |  __/ | |             ",
+    rf"     {_RED}| |   | | | || | | |{_BLUE} | |\ \ | |    | \__/\         ",
+    rf"     {_RED}\_|   \_| |_/\_| |_/{_BLUE} \_| \_|\_|     \____/         ",
+)
+HEADER_SIGNATURE = f"               {COLORS['gray']}By Bandokii & GitHub Copilot{COLORS['reset']}"
+_HZ = "═"
+HEADER_DIVIDER = f"           {_BLUE}{_HZ * 14}{COLORS['white']}{_HZ}{_RED}{_HZ * 14}{COLORS['reset']}"
+# Complete banner, composed once at import
+HEADER_TEXT = "\n" + "\n".join((*HEADER_LINES, HEADER_SIGNATURE, HEADER_DIVIDER)) + "\n\n"
+
+
 def print_header(config: dict) -> None:
     """
     Prints the ASCII art FAHRPC logo header to console.
@@ -151,30 +335,83 @@ def print_header(config: dict) -> None:
     if not config['display']['show_header']:
         return
 
-    # Color assignments for the two-tone FAH | RPC effect
-    RED = COLORS['red']
-    BLUE = COLORS['blue']
-    GRAY = COLORS['gray']
-    RESET = COLORS['reset']
-    WHITE = COLORS['white']
+    sys.stdout.write(HEADER_TEXT)
+    sys.stdout.flush()
+
+
+def make_colored_names(nvidia_names: List[str], amd_names: List[str]) -> Dict[str, str]:
+    """
+    Pre-colors detected GPU names by vendor (Nvidia green, AMD red).
+
+    Args:
+        nvidia_names: Names of detected Nvidia GPUs
+        amd_names: Names of detected AMD GPUs
 
-    # ASCII art - "FAH" in red, "RPC" in blue
-    lines = [
-        rf"     {RED}______  ___   _   _{BLUE}  ______ ______  _____          ",
-        rf"     {RED}|  ___|/ _ \ | | | |{BLUE} | ___ \| ___ \/  __ \         ",
-        rf"     {RED}| |_  / /_\ \| |_| |{BLUE} | |_/ /| |_/ /| /  \/         ",
-        rf"     {RED}|  _| |  _  ||  _  |{BLUE} |    / |  __/ | |             ",
-        rf"     {RED}| |   | | | || | | |{BLUE} | |\ \ | |    | \__/\         ",
-        rf"     {RED}\_|   \_| |_/\_| |_/{BLUE} \_| \_|\_|     \____/         ",
-    ]
+    Returns:
+        Dict mapping each GPU name to its ANSI-colored form
+    """
+    colored = {name: f"{COLORS['red']}{name}{COLORS['reset']}" for name in amd_names}
+    # Nvidia last, so a name shared by both vendors stays green as before
+    colored.update({name: f"{COLORS['green']}{name}{COLORS['reset']}" for name in nvidia_names})
+    return colored
 
-    signature = f"               {GRAY}By Bandokii & GitHub Copilot{RESET}"
-    hz = "═"
-    divider = f"           {BLUE}{hz * 14}{WHITE}{hz}{RED}{hz * 14}{RESET}"
 
-    print("\n" + "\n".join(lines))
-    print(signature)
-    print(f"{divider}\n")
+def format_gpu_output(
+    gpu_data: List[Tuple[str, Any, Any]],
+    colored_names: Dict[str, str],
+    get_temp_color: Callable[[Any], str],
+) -> Tuple[str, str]:
+    """
+    Formats GPU readings for the console and for Discord Rich Presence.
+
+    Args:
+        gpu_data: (name, utilization, temperature) per GPU
+        colored_names: GPU name -> vendor-colored name, from make_colored_names()
+        get_temp_color: Temperature-to-color lookup from make_temp_color()
+
+    Returns:
+        Tuple of (console_output, rpc_gpu_text)
+    """
+    # Format GPU lines for console, totalling readings for the averages
+    gpu_lines_console = []
+    util_total = 0
+    temp_total = 0
+    temp_count = 0
+    for name, util, temp in gpu_data:
+        util_total += util
+        # AMD sensors may report "N/A"; leave those out of the averages
+        if temp != "N/A":
+            temp_total += temp
+            temp_count += 1
+        t_color = get_temp_color(temp)
+        temp_display = f"{temp}°c" if temp != "N/A" else "N/A"
+        # Color GPU name by vendor
+        name_colored = colored_names.get(name) or f"{COLORS['red']}{name}{COLORS['reset']}"
+        gpu_lines_console.append(f"{name_colored} │ {util}% - {t_color}{temp_display}{COLORS['reset']}")
+
+    # Format for RPC
+    if not gpu_lines_console:
+        rpc_gpu_text = "GPU Info Unavailable"
+        console_output = f"{COLORS['red']}GPU Info Unavailable{COLORS['reset']}"
+    else:
+        total_gpus = len(gpu_data)
+        if total_gpus == 1:
+            raw_name, util, temp_val = gpu_data[0]  # Uncolored name, no ANSI stripping needed
+            temp_str = f"{temp_val}°c" if temp_val != "N/A" else "N/A"
+            rpc_gpu_text = f"{raw_name} │ {util}% - {temp_str}"
+        else:
+            # Floor division keeps integer readings out of float math
+            # (int() still covers AMD sensors that report floats)
+            avg_util = int(util_total // total_gpus)
+            temp_str = f"{int(temp_total // temp_count)}°c" if temp_count else "N/A"
+            rpc_gpu_text = f"GPUs: {total_gpus} │ x̄ {avg_util}% - x̄ {temp_str}"
+
+        # Format console output with padding
+        console_output = gpu_lines_console[0]
+        for line in gpu_lines_console[1:]:
+            console_output += f"\n{PADDING_STR}{line}"
+
+    return console_output, rpc_gpu_text
 
 
 # ============================================================================
@@ -193,10 +430,11 @@ async def main_logic() -> None:
     - Graceful shutdown and cleanup
     """
     global logger
+    from fahrpc import DiscordRPC, FAHScraper, GPUMonitor
 
     # Ensure logger is initialized (fallback for async entry)
     if logger is None:
-        config = load_config()
+        config = get_config()
         log_file = str(get_log_path(config['logging']['error_log_file']))
         logger = setup_error_logging(
             log_file,
@@ -204,8 +442,7 @@ async def main_logic() -> None:
         )
 
     # Enable ANSI colors on Windows (required for colored output)
-    if sys.platform == "win32":
-        os.system('color')
+    enable_ansi_colors()
 
     # ========================================================================
     # Startup Logging
@@ -217,13 +454,14 @@ async def main_logic() -> None:
     logger.info(f"Python: {sys.version}")
     logger.info(f"Executable: {sys.executable}")
 
-    config = load_config()
+    config = get_config()
     logger.info(f"Configuration loaded from: {get_log_path().parent}")
     logger.debug(f"Config keys: {list(config.keys())}")
+    get_temp_color = make_temp_color(config)
 
     # Print header
     print_header(config)
-    print(f" {get_timestamp()} {COLORS['white']}[*] Initializing Hardware Monitor...{COLORS['reset']}")
+    print(MSG_INIT_HARDWARE.format(ts=get_timestamp()))
     logger.info("[STARTUP] Initializing Hardware Monitor")
 
     # Initialize hardware monitor
@@ -235,31 +473,37 @@ async def main_logic() -> None:
         print(f" {get_timestamp()} {COLORS['red']}[!] GPU Monitor Error: {e}{COLORS['reset']}")
         return
 
-    # Display detected hardware
+    # Display detected hardware (collected and written in one go)
     ts = get_timestamp()
+    hardware_lines: List[str] = []
     if gpu_monitor.nvidia_count == 0:
-        print(f" {ts} {COLORS['red']}[-] Found Nvidia GPU: 0{COLORS['reset']}")
+        hardware_lines.append(f" {ts} {COLORS['red']}[-] Found Nvidia GPU: 0{COLORS['reset']}")
         logger.info("[STARTUP] Nvidia GPU count: 0")
     else:
-        print(f" {ts} {COLORS['green']}[+] Found Nvidia GPU: {gpu_monitor.nvidia_count}{COLORS['reset']}")
+        hardware_lines.append(
+            f" {ts} {COLORS['green']}[+] Found Nvidia GPU: {gpu_monitor.nvidia_count}{COLORS['reset']}"
+        )
         logger.info(f"[STARTUP] Found {gpu_monitor.nvidia_count} Nvidia GPU(s)")
         for name in gpu_monitor.nvidia_names:
-            print(f"{HARDWARE_PADDING}└─ {name}")
+            hardware_lines.append(f"{HARDWARE_PADDING}└─ {name}")
             logger.debug(f"[STARTUP] Nvidia GPU: {name}")
 
     if gpu_monitor.amd_count == 0:
-        print(f" {ts} {COLORS['red']}[-] Found AMD GPU: 0{COLORS['reset']}")
+        hardware_lines.append(f" {ts} {COLORS['red']}[-] Found AMD GPU: 0{COLORS['reset']}")
         logger.info("[STARTUP] AMD GPU count: 0")
     else:
-        print(f" {ts} {COLORS['green']}[+] Found AMD GPU: {gpu_monitor.amd_count}{COLORS['reset']}")
+        hardware_lines.append(
+            f" {ts} {COLORS['green']}[+] Found AMD GPU: {gpu_monitor.amd_count}{COLORS['reset']}"
+        )
         logger.info(f"[STARTUP] Found {gpu_monitor.amd_count} AMD GPU(s)")
-        for dev in gpu_monitor.amd_devices:
-            clean_name = dev.adapterName.replace(config['hardware']['amd']['strip_prefix'], "").strip()
-            print(f"{HARDWARE_PADDING}└─ {clean_name}")
-            logger.debug(f"[STARTUP] AMD GPU: {clean_name}")
+        for name in gpu_monitor.amd_names:
+            hardware_lines.append(f"{HARDWARE_PADDING}└─ {name}")
+            logger.debug(f"[STARTUP] AMD GPU: {name}")
+    write_console(hardware_lines)
+    colored_names = make_colored_names(gpu_monitor.nvidia_names, gpu_monitor.amd_names)
 
     # Initialize scraper
-    print(f" {get_timestamp()} {COLORS['white']}[*] Launching Web Scraper engine...{COLORS['reset']}")
+    print(MSG_LAUNCH_SCRAPER.format(ts=get_timestamp()))
     logger.info("[STARTUP] Initializing FAH web scraper")
     scraper = FAHScraper(config)
     logger.debug("[STARTUP] FAHScraper instance created")
@@ -270,7 +514,7 @@ async def main_logic() -> None:
         logger.info("[STARTUP] Playwright browser initialization starting...")
         await scraper.initialize()
         logger.info("[STARTUP] Playwright browser initialized successfully")
-        print(f" {get_timestamp()} {COLORS['green']}[OK] Scraper engine ready.{COLORS['reset']}")
+        print(MSG_SCRAPER_READY.format(ts=get_timestamp()))
     except Exception as e:
         if logger:
             logger.error(f"[STARTUP] Browser initialization failed: {e}", exc_info=True)
@@ -279,7 +523,7 @@ async def main_logic() -> None:
         return
 
     # Initialize Discord RPC
-    print(f" {get_timestamp()} {COLORS['white']}[*] Attempting Discord connection...{COLORS['reset']}")
+    print(MSG_DISCORD_CONNECTING.format(ts=get_timestamp()))
     logger.info("[STARTUP] Initializing Discord RPC client")
     discord = DiscordRPC(config)
     logger.debug(f"[STARTUP] Discord RPC config: CLIENT_ID={config['discord']['client_id']}")
@@ -294,8 +538,16 @@ async def main_logic() -> None:
     fifty_percent_synced = False
     discord_lost_logged = False
     fah_lost_logged = False
+    gpu_error_logged = False
+    last_loop_error = None  # repr of the last loop error, so repeats skip the traceback
     last_discord_status = False
     last_fah_status = False
+    presence_cleared = False  # True once the presence is cleared while paused
+    last_gpu_data = None  # GPU readings behind the cached console/RPC text
+    console_output, rpc_gpu_text = "", ""
+    # Background stats sync, and whether it was started at >= 50% progress
+    stats_task: Optional[asyncio.Task] = None
+    stats_task_at_half = False
 
     update_interval = config['foldingathome']['update_interval']
 
@@ -310,51 +562,93 @@ async def main_logic() -> None:
                 if await discord.connect():
                     if not last_discord_status:
                         logger.info("[MAIN LOOP] Discord connection established")
-                        print(f" {get_timestamp()} {COLORS['green']}[OK] Discord connection stable.{COLORS['reset']}")
+                        print(MSG_DISCORD_OK.format(ts=get_timestamp()))
                         last_discord_status = True
                     force_stats_sync = True
                     discord_lost_logged = False
                 else:
                     if not discord_lost_logged:
                         logger.warning("[MAIN LOOP] Discord connection unavailable")
-                        print(f" {get_timestamp()} {COLORS['red']}[!] Discord not found.{COLORS['reset']}")
-                        print(f"{HARDWARE_PADDING}└─ Retrying...{COLORS['reset']}")
+                        write_console([
+                            MSG_DISCORD_NOT_FOUND.format(ts=get_timestamp()),
+                            MSG_RETRYING,
+                        ])
                         discord_lost_logged = True
                         last_discord_status = False
                     await asyncio.sleep(update_interval)
                     continue
 
+            # Per-tick status lines, written in one go at the end of the tick
+            output_parts: List[str] = []
+
             try:
+                # Scrape FAH control data, polling the GPUs concurrently while
+                # folding. A paused machine isn't polled at all; the first
+                # running tick after a pause polls once it sees the state.
+                if was_running_last_check:
+                    control_result, gpu_result = await asyncio.gather(
+                        scraper.get_control_data(),
+                        gpu_monitor.get_all_gpu_data_async(),
+                        return_exceptions=True,
+                    )
+                else:
+                    (control_result,) = await asyncio.gather(
+                        scraper.get_control_data(), return_exceptions=True
+                    )
+                    gpu_result = None
+
                 # Get FAH control data with error handling
                 try:
-                    percents, proj_ids, is_running = await scraper.get_control_data()
+                    if isinstance(control_result, BaseException):
+                        raise control_result
+                    percents, proj_ids, is_running = control_result
                     last_fah_status = True
                 except Exception as e:
                     if not fah_lost_logged:
                         logger.error(f"FAH connection lost: {e}", exc_info=True)
-                        err_msg = f"[!] FAH connection lost: {str(e)[:50]}..."
-                        print(f" {get_timestamp()} {COLORS['red']}{err_msg}{COLORS['reset']}")
-                        print(f"{HARDWARE_PADDING}└─ Retrying connection...{COLORS['reset']}")
+                        write_console([
+                            MSG_FAH_LOST.format(ts=get_timestamp(), error=str(e)[:50]),
+                            MSG_RETRYING_CONNECTION,
+                        ])
                         fah_lost_logged = True
                         last_fah_status = False
                     await asyncio.sleep(update_interval)
                     continue
 
+                # One timestamp for the tick's lines, refreshed after each await
+                ts = get_timestamp()
+
                 if not last_fah_status:
-                    print(f" {get_timestamp()} {COLORS['green']}[OK] FAH connection restored.{COLORS['reset']}")
+                    output_parts.append(MSG_FAH_RESTORED.format(ts=ts))
                     last_fah_status = True
                     fah_lost_logged = False
 
                 # Check for status changes
                 if is_running and not was_running_last_check:
-                    print(f" {get_timestamp()} {COLORS['green']}[+] Folding has started/resumed.{COLORS['reset']}")
+                    output_parts.append(MSG_FOLDING_STARTED.format(ts=ts))
                     force_stats_sync = True
                 elif not is_running and was_running_last_check:
-                    print(f" {get_timestamp()} {COLORS['yellow']}[!] Folding is currently paused.{COLORS['reset']}")
+                    output_parts.append(MSG_FOLDING_PAUSED.format(ts=ts))
 
                 was_running_last_check = is_running
 
                 if is_running:
+                    # Collect a stats sync started on an earlier tick
+                    if stats_task is not None and stats_task.done():
+                        new_pts, new_wus = stats_task.result()
+                        stats_task = None
+                        if new_pts:
+                            global_points, global_wus = new_pts, new_wus
+                            sync_status = 'synced'
+                            # Mark 50% sync as done if triggered by 50%
+                            if stats_task_at_half:
+                                fifty_percent_synced = True
+                            output_parts.append(
+                                MSG_STATSYNC_OK.format(ts=ts, points=global_points, wus=global_wus)
+                            )
+                        else:
+                            sync_status = 'idle'
+
                     # Check if we need to sync stats
                     # Use first project for sync logic (legacy behavior)
                     percent_float = 0.0
@@ -378,122 +672,65 @@ async def main_logic() -> None:
                         sync_status = 'pending'
                         force_stats_sync = False
                         last_known_project = proj_id
-                        print(f" {get_timestamp()} {COLORS['white']}[+] StatSync...{COLORS['reset']}")
-                        new_pts, new_wus = await scraper.get_global_stats()
-                        if new_pts:
-                            global_points, global_wus = new_pts, new_wus
-                            sync_status = 'synced'
-                            # Mark 50% sync as done if triggered by 50%
-                            if percent_float >= 50.0:
-                                fifty_percent_synced = True
-                            stats_msg = f"{global_points} pts │ {global_wus} WUs"
-                            white = COLORS['white']
-                            reset = COLORS['reset']
-                            print(f" {get_timestamp()} {COLORS['green']}[OK] StatSync: {white}{stats_msg}{reset}")
-                        else:
-                            sync_status = 'idle'
+                        output_parts.append(MSG_STATSYNC.format(ts=ts))
+                        # The stats page can take seconds to load; fetch it
+                        # alongside the following ticks instead of stalling
+                        # this one (get_global_stats never raises)
+                        stats_task_at_half = percent_float >= 50.0
+                        stats_task = asyncio.create_task(scraper.get_global_stats())
 
                     # Get GPU data with error handling
-                    try:
-                        gpu_data, utilizations, temperatures = gpu_monitor.get_all_gpu_data()
-                    except Exception as e:
-                        if logger:
-                            logger.error(f"GPU data retrieval failed: {e}", exc_info=True)
-                        gpu_data, utilizations, temperatures = [], [], []
-
-                    # Format GPU lines for console
-                    gpu_lines_console = []
-                    for name, util, temp in gpu_data:
-                        t_color = get_temp_color(temp, config)
-                        temp_display = f"{temp}°c" if temp != "N/A" else "N/A"
-                        # Color GPU name by vendor
-                        if name in gpu_monitor.nvidia_names:
-                            name_colored = f"{COLORS['green']}{name}{COLORS['reset']}"
-                        else:
-                            name_colored = f"{COLORS['red']}{name}{COLORS['reset']}"
-                        gpu_lines_console.append(f"{name_colored} │ {util}% - {t_color}{temp_display}{COLORS['reset']}")
-
-                    # Format for RPC
-                    if not gpu_lines_console:
-                        rpc_gpu_text = "GPU Info Unavailable"
-                        console_output = f"{COLORS['red']}GPU Info Unavailable{COLORS['reset']}"
+                    if gpu_result is None:
+                        # Resumed this tick, so the GPUs weren't polled above
+                        try:
+                            gpu_result = await gpu_monitor.get_all_gpu_data_async()
+                        except Exception as e:
+                            gpu_result = e
+                    if isinstance(gpu_result, BaseException):
+                        # Full traceback once per failure streak, not every tick
+                        if logger and not gpu_error_logged:
+                            logger.error(f"GPU data retrieval failed: {gpu_result}", exc_info=gpu_result)
+                            gpu_error_logged = True
+                        gpu_data = []
                     else:
-                        total_gpus = len(utilizations)
-                        if total_gpus == 1:
-                            raw_name = strip_ansi(gpu_lines_console[0].split('│')[0].strip())
-                            temp_val = temperatures[0] if temperatures else "N/A"
-                            temp_str = f"{temp_val}°c" if temp_val != "N/A" else "N/A"
-                            rpc_gpu_text = f"{raw_name} │ {utilizations[0]}% - {temp_str}"
-                        else:
-                            avg_util = int(sum(utilizations) / total_gpus)
-                            avg_temp = int(sum(temperatures) / len(temperatures)) if temperatures else "N/A"
-                            temp_str = f"{avg_temp}°c" if avg_temp != "N/A" else "N/A"
-                            rpc_gpu_text = f"GPUs: {total_gpus} │ x̄ {avg_util}% - x̄ {temp_str}"
-
-                        # Format console output with padding
-                        prefix_str = f"FAH{COLORS['blue']}RPC{COLORS['reset']} -"
-                        ts_str = get_timestamp()
-                        padding_len = len(strip_ansi(ts_str)) + 1 + len(strip_ansi(prefix_str)) + 1
-                        padding_str = " " * padding_len
+                        gpu_data = gpu_result
+                        gpu_error_logged = False
 
-                        console_output = gpu_lines_console[0]
-                        for line in gpu_lines_console[1:]:
-                            console_output += f"\n{padding_str}{line}"
+                    # Readings usually repeat between ticks on a steady fold, so
+                    # the console/RPC text is only rebuilt when they change
+                    if gpu_data != last_gpu_data:
+                        console_output, rpc_gpu_text = format_gpu_output(
+                            gpu_data, colored_names, get_temp_color
+                        )
+                        last_gpu_data = gpu_data
 
                     # Console logging cycles (unchanged)
                     if cycle_index % 2 == 0:
-                        indent = ' ' * 21
-                        detail_texts = []
-                        for idx, (pid, pct) in enumerate(zip(proj_ids, percents)):
-                            prefix = indent if idx > 0 else ''
-                            white = COLORS['white']
-                            yellow = COLORS['yellow']
-                            reset = COLORS['reset']
-                            proj_line = f"{white}Project{reset} │ {pid} - {yellow}{pct}%{reset}"
-                            detail_texts.append(f"{prefix}{proj_line}")
-                        console_line_final = "\n".join(detail_texts)
+                        console_line_final = PROJ_LINE_SEP.join(
+                            f"{PROJ_LINE_HEAD}{pid}{PCT_WRAP[0]}{pct}{PCT_WRAP[1]}"
+                            for pid, pct in zip(proj_ids, percents)
+                        )
                     else:
                         console_line_final = console_output
 
                     # Discord Rich Presence cycle logic (separate from console)
-                    num_projects = len(proj_ids)
-                    discord_cycle = 0
-                    if num_projects >= 2:
-                        discord_cycle = cycle_index % 3
-                        if discord_cycle == 0:
-                            detail_text = f"pTotal: {global_points}"
-                            state_text = f"WUs Completed: {global_wus}"
-                        elif discord_cycle == 1:
-                            detail_text = f"Project {proj_ids[0]} - {percents[0]}%"
-                            state_text = f"Project {proj_ids[1]} - {percents[1]}%"
-                        else:
-                            detail_text = rpc_gpu_text
-                            state_text = '"hyper modern space heater"'
-                    elif num_projects == 1:
-                        discord_cycle = cycle_index % 2
-                        if discord_cycle == 0:
-                            detail_text = f"pTotal: {global_points}"
-                            state_text = f"WUs Completed: {global_wus}"
-                        else:
-                            detail_text = rpc_gpu_text
-                            state_text = f"Project {proj_ids[0]} - {percents[0]}%"
-                    else:
-                        detail_text = f"pTotal: {global_points}"
-                        state_text = f"WUs Completed: {global_wus}"
+                    cycle = CYCLE_TABLE[min(len(proj_ids), 2)]
+                    detail_text, state_text = cycle[cycle_index % len(cycle)](
+                        proj_ids, percents, global_points, global_wus, rpc_gpu_text
+                    )
 
                     # Update Discord RPC with error handling
                     try:
                         if await discord.update(detail_text, state_text):
+                            presence_cleared = False
                             # Project line: [timestamp] FAHRPC - Project │ <project_id> - <percent>%
                             # GPU line: [timestamp] FAHRPC - <gpu info>
-                            fah_rpc_colored = f"{COLORS['red']}FAH{COLORS['blue']}RPC{COLORS['reset']}"
-                            print(f" {get_timestamp()} {fah_rpc_colored} - {console_line_final}")
+                            output_parts.append(MSG_STATUS_LINE.format(ts=ts, body=console_line_final))
                             cycle_index += 1
                         else:
                             if not discord_lost_logged:
-                                print(f" {get_timestamp()} {COLORS['red']}[!] Discord not found.{COLORS['reset']}")
-                                retry_msg = f"└─ Retrying every {update_interval} seconds..."
-                                print(f"{HARDWARE_PADDING}{retry_msg}{COLORS['reset']}")
+                                output_parts.append(MSG_DISCORD_NOT_FOUND.format(ts=ts))
+                                output_parts.append(MSG_RETRYING_EVERY.format(interval=update_interval))
                                 discord_lost_logged = True
                     except Exception as e:
                         if logger:
@@ -501,16 +738,28 @@ async def main_logic() -> None:
                         if not discord_lost_logged:
                             discord_lost_logged = True
                 else:
-                    # Not running, clear RPC
-                    try:
-                        await discord.clear()
-                    except Exception as e:
-                        if logger:
-                            logger.error(f"Discord RPC clear failed: {e}", exc_info=True)
+                    # Not running, clear RPC once on the transition rather than every tick
+                    if not presence_cleared:
+                        try:
+                            await discord.clear()
+                            presence_cleared = True
+                        except Exception as e:
+                            if logger:
+                                logger.error(f"Discord RPC clear failed: {e}", exc_info=True)
+
+                write_console(output_parts)
+                last_loop_error = None
 
             except Exception as e:
+                write_console(output_parts)
                 if logger:
-                    logger.error(f"Main loop iteration error: {e}", exc_info=True)
+                    # The same error repeating every tick only gets its traceback once
+                    error_key = repr(e)
+                    if error_key != last_loop_error:
+                        logger.error(f"Main loop iteration error: {e}", exc_info=True)
+                        last_loop_error = error_key
+                    elif logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"Main loop iteration error (repeated): {e}")
                 await asyncio.sleep(update_interval)
                 continue
 
@@ -518,11 +767,19 @@ async def main_logic() -> None:
 
     finally:
         # Graceful shutdown and cleanup
-        print(f"\n {get_timestamp()} {COLORS['yellow']}[*] Shutting down gracefully...{COLORS['reset']}")
+        print(MSG_SHUTTING_DOWN.format(ts=get_timestamp()))
+
+        # Stop an in-flight stats sync before its page is closed
+        if stats_task is not None and not stats_task.done():
+            stats_task.cancel()
+            try:
+                await stats_task
+            except asyncio.CancelledError:
+                pass
 
         try:
             await discord.close()
-            print(f" {get_timestamp()} {COLORS['green']}[OK] Discord connection closed.{COLORS['reset']}")
+            print(MSG_DISCORD_CLOSED.format(ts=get_timestamp()))
         except Exception as e:
             if logger:
                 logger.error(f"[SHUTDOWN] Error closing Discord connection: {e}", exc_info=True)
@@ -530,7 +787,7 @@ async def main_logic() -> None:
         try:
             await scraper.close()
             logger.info("[SHUTDOWN] Web scraper closed")
-            print(f" {get_timestamp()} {COLORS['green']}[OK] Scraper engine closed.{COLORS['reset']}")
+            print(MSG_SCRAPER_CLOSED.format(ts=get_timestamp()))
         except Exception as e:
             if logger:
                 logger.error(f"[SHUTDOWN] Error closing scraper: {e}", exc_info=True)
@@ -539,7 +796,7 @@ async def main_logic() -> None:
         if logger:
             logger.info("[SHUTDOWN] Shutdown complete")
             logger.info("=" * 80)
-        print(f" {get_timestamp()} {COLORS['green']}[OK] Shutdown complete.{COLORS['reset']}")
+        print(MSG_SHUTDOWN_COMPLETE.format(ts=get_timestamp()))
 
 async def main_loop() -> None:
     """
@@ -547,24 +804,52 @@ async def main_loop() -> None:
 
     Manages the application lifecycle including restarts and graceful shutdown.
     """
-    while not stop_event.is_set():
-        restart_event.clear()
-        task = asyncio.create_task(main_logic())
+    from fahrpc import shutdown_browser
 
-        while not restart_event.is_set() and not stop_event.is_set():
-            await asyncio.sleep(1)
+    try:
+        while not stop_event.is_set():
+            restart_event.clear()
+            task = asyncio.create_task(main_logic())
 
-        task.cancel()
-        try:
-            await task
-        except asyncio.CancelledError:
-            pass
+            # Sleep until the tray menu or a signal requests restart/shutdown
+            await wait_for_any(restart_event, stop_event)
 
-        await asyncio.sleep(0.5)
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+            await asyncio.sleep(0.5)
+
+            if restart_event.is_set():
+                print(MSG_RESTARTING.format(ts=get_timestamp()))
+                reload_config()
+                await asyncio.sleep(1)
+    finally:
+        # The browser outlives restarts; close it once on the way out
+        await shutdown_browser()
+
+
+def install_fast_event_loop() -> bool:
+    """
+    Switches asyncio to uvloop when it is installed (optional - fahrpc[fast]).
+
+    uvloop has no Windows support, so Windows keeps the default Proactor
+    loop, which Playwright needs for its driver subprocess.
+
+    Returns:
+        True if uvloop was installed as the event loop policy
+    """
+    if sys.platform == "win32":
+        return False
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
 
-        if restart_event.is_set():
-            print(f"\n {get_timestamp()} {COLORS['yellow']}[*] Restarting logic...{COLORS['reset']}")
-            await asyncio.sleep(1)
 
 def main() -> None:
     """Entry point for fahrpc command."""
@@ -582,6 +867,8 @@ def main() -> None:
     logger.info("FAHRPC Application Entry Point")
     logger.info("=" * 80)
 
+    from fahrpc import GPUMonitor, TrayIcon, set_console_visibility
+
     # Define graceful shutdown handler
     def signal_handler(signum: int, frame) -> None:
         """Handle shutdown signals (SIGTERM, SIGINT)."""
@@ -617,7 +904,10 @@ def main() -> None:
         print(f" {get_timestamp()} {COLORS['red']}[!] Tray Error: {e}{COLORS['reset']}")
 
     # Run main loop
+    fatal_error = False
     try:
+        if install_fast_event_loop():
+            logger.info("[MAIN] Using uvloop event loop")
         logger.info("[MAIN] Starting main event loop")
         asyncio.run(main_loop())
     except KeyboardInterrupt:
@@ -629,7 +919,7 @@ def main() -> None:
         logger.error(f"[MAIN] Unhandled exception in main loop: {e}", exc_info=True)
         set_console_visibility(True)
         print(f"\n {get_timestamp()} {COLORS['red']}[FATAL ERROR]: {e}{COLORS['reset']}")
-        input("Press Enter to close...")
+        fatal_error = True
     finally:
         logger.info("[MAIN] Shutting down GPU monitor")
         try:
@@ -638,5 +928,12 @@ def main() -> None:
             logger.error(f"[MAIN] Error during GPU monitor shutdown: {e}", exc_info=True)
         logger.info("[MAIN] Application exited")
 
+    if fatal_error:
+        # GPU handles are already released; only hold the window open for
+        # someone at an interactive console to read the error
+        if sys.stdin and sys.stdin.isatty() and sys.stdout and sys.stdout.isatty():
+            input("Press Enter to close...")
+        sys.exit(1)
+
 if __name__ == "__main__":
     main()
@@ -7,8 +7,10 @@ Handles web scraping of Folding@Home web interfaces using Playwright.
 Features:
     - Scrapes local FAH control interface for project progress
     - Scrapes global FAH stats page for points and work units
-    - Smart caching with 5-minute TTL to reduce server load
+    - Adaptive stats caching (1-30 minute TTL, starting at 5) to reduce server load
     - Headless Chromium browser for reliable rendering
+    - One shared browser per process, reused across restarts
+    - Images, fonts and trackers blocked on the stats page (only page text is read)
     - Regex-based data extraction for speed
 
 Data Sources:
@@ -21,13 +23,17 @@ Example usage:
     >>> await scraper.initialize()
     >>> percents, projects, is_running = await scraper.get_control_data()
     >>> points, wus = await scraper.get_global_stats()
+    >>> await scraper.close()
+    >>> await shutdown_browser()  # On application exit
 """
 
+import asyncio
 import logging
 import re
 import time
 from typing import Any, Dict, Optional, Tuple
 
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 from playwright.async_api import async_playwright
 
 from fahrpc.config import APP_NAME
@@ -38,16 +44,210 @@ logger = logging.getLogger(APP_NAME.upper())
 # Regex Patterns for FAH Page Parsing
 # ============================================================================
 # These patterns extract data from FAH web interface HTML
-# Pre-compiled for performance since they're used repeatedly
+# Pre-compiled for performance since they're used repeatedly. FAH pages only
+# emit ASCII digits, so re.ASCII keeps \d to [0-9] (matching JavaScript's \d,
+# which RE_PROJ_ID's pattern is also run as).
 
 # Matches: <div class="user-points">1,234,567 points earned</div>
-RE_POINTS = re.compile(r'<div class="user-points">([\d,]+) points earned</div>')
+RE_POINTS = re.compile(r'<div class="user-points">([\d,]+) points earned</div>', re.ASCII)
 
 # Matches: <div class="user-wus">123 WUs completed</div>
-RE_WUS = re.compile(r'<div class="user-wus">([\d,]+) WUs completed</div>')
+RE_WUS = re.compile(r'<div class="user-wus">([\d,]+) WUs completed</div>', re.ASCII)
+
+# Matches: the count in a totals element's text (e.g. "1,234,567 points earned")
+RE_COUNT = re.compile(r'[\d,]+', re.ASCII)
+
+# Matches: the number in a progress label (e.g. " 45.3%" -> 45.3)
+RE_PERCENT = re.compile(r'\d+(?:\.\d+)?', re.ASCII)
 
 # Matches: 5-digit project IDs (e.g., 12345, 67890)
-RE_PROJ_ID = re.compile(r'\b\d{5}\b')
+RE_PROJ_ID = re.compile(r'\b\d{5}\b', re.ASCII)
+
+# Rendered by the stats page's scripts once the user's totals are loaded
+STATS_READY_SELECTOR = 'div.user-points'
+
+# Text of the points and WUs elements (null when missing), read in one call
+STATS_SNAPSHOT_JS = """() => ['div.user-points', 'div.user-wus'].map(
+    sel => { const e = document.querySelector(sel); return e ? e.textContent : null; }
+)"""
+
+# Elements whose presence means the control page has rendered its data
+CONTROL_READY_SELECTOR = '.progress-text, .state-run'
+
+# Reads everything get_control_data needs from the control page in one call.
+# Project IDs are matched in the page (with RE_PROJ_ID's pattern, which is
+# also valid JavaScript), so only the IDs cross over instead of the body text.
+CONTROL_SNAPSHOT_JS = """(projIdPattern) => ({
+    prog: Array.from(document.querySelectorAll('.progress-text'), e => e.textContent),
+    ids: (document.body ? document.body.innerText : '').match(new RegExp(projIdPattern, 'g')) || [],
+    running: document.querySelector('.state-run') !== null,
+})"""
+
+# The control page updates itself live, so it is only re-navigated after an
+# error, when it shows no data, or once it is this old (seconds)
+CONTROL_PAGE_MAX_AGE = 60
+
+# The control page is local, so a load that takes longer than this (seconds)
+# is treated as failed. Playwright's own timeout is a 1.5x safety net.
+CONTROL_LOAD_TIMEOUT = 4.0
+
+# After a failed control page load, further loads are skipped for a delay
+# that doubles per consecutive failure (1s, 2s, 4s... up to the cap)
+CONTROL_RETRY_INITIAL = 1.0  # seconds
+CONTROL_RETRY_MAX = 30.0     # seconds
+
+# Control data read within this many seconds of the last read is reused,
+# since the page itself only refreshes every few seconds
+CONTROL_CACHE_TTL = 2.0
+
+# Stats cache lifetime bounds (seconds). The TTL doubles while the totals
+# come back unchanged and halves when they change, starting from the default.
+STATS_CACHE_TTL_DEFAULT = 300
+STATS_CACHE_TTL_MIN = 60
+STATS_CACHE_TTL_MAX = 1800
+
+
+def _find_near(content: str, anchor: str, pattern: re.Pattern) -> Optional[str]:
+    """
+    Run a totals regex over the slice of HTML around its element.
+
+    str.find locates the element far faster than a regex pass over the whole
+    page; the full page is only scanned if the anchor text isn't present.
+
+    Args:
+        content: Page HTML
+        anchor: Literal text of the element's class attribute
+        pattern: Compiled regex with the value in group 1
+
+    Returns:
+        First captured value, or None if there is no match
+    """
+    idx = content.find(anchor)
+    window = content[max(idx - 100, 0):idx + 500] if idx >= 0 else content
+    match = pattern.search(window)
+    return match.group(1) if match else None
+
+
+# ============================================================================
+# Request Filtering
+# ============================================================================
+# Requests the stats page never needs. Only its DOM text is read, so it
+# renders fine without media, styling or trackers, and loads with far less
+# data transferred. Routing turns off Playwright's HTTP cache for the page,
+# so this trades cached app-bundle loads for skipping those downloads. The
+# local control page isn't routed: it loses nothing on the network, and
+# routing would stall each of its requests on a round-trip through Python.
+STATS_BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media", "stylesheet"})
+BLOCKED_HOSTS = (
+    "doubleclick.net",
+    "google-analytics.com",
+    "googletagmanager.com",
+    "googlesyndication.com",
+    "hotjar.com",
+    "facebook.net",
+    "scorecardresearch.com",
+)
+
+
+async def _route_stats(route: Any) -> None:
+    """Abort media, styling and tracker requests from the stats page."""
+    request = route.request
+    if request.resource_type in STATS_BLOCKED_RESOURCE_TYPES or any(
+        host in request.url for host in BLOCKED_HOSTS
+    ):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+# ============================================================================
+# Shared Browser
+# ============================================================================
+# Starting Playwright and launching Chromium takes seconds, so one browser
+# serves the whole process: a restart from the tray menu only opens a new
+# context and pages. The browser is relaunched once it reaches
+# BROWSER_MAX_AGE or BROWSER_MAX_USES contexts, so a leaking Chromium
+# process can't live forever.
+
+BROWSER_MAX_AGE = 24 * 60 * 60  # seconds
+BROWSER_MAX_USES = 50           # contexts opened on one browser
+
+# Chromium switches that turn off background work a scraper never uses
+# (component/extension updates, sync, translate) so it stays quieter on the
+# network and lighter in memory
+CHROMIUM_ARGS = (
+    '--disable-dev-shm-usage',          # Use /tmp instead of a small /dev/shm (Linux/containers)
+    '--disable-extensions',             # No extension processes
+    '--disable-background-networking',  # No update/safe-browsing/etc. fetches
+    '--disable-component-update',       # No component downloads
+    '--disable-default-apps',           # No default app installation
+    '--disable-sync',                   # No account sync
+    '--no-first-run',                   # Skip first-run tasks
+    '--disable-features=Translate',     # No translate prompts/model downloads
+)
+
+_playwright = None
+_browser = None
+_browser_started_at: float = 0.0
+_browser_uses = 0
+_browser_lock = asyncio.Lock()
+
+
+async def _close_browser() -> None:
+    """Close the shared browser, ignoring errors from an already-dead process."""
+    global _browser
+    if _browser is not None:
+        try:
+            await _browser.close()
+        except Exception:
+            pass
+        _browser = None
+
+
+async def acquire_browser() -> Any:
+    """
+    Get the shared Chromium browser, launching or recycling it as needed.
+
+    Returns:
+        Playwright Browser instance
+
+    Raises:
+        Exception: If Playwright or Chromium fails to start
+    """
+    global _playwright, _browser, _browser_started_at, _browser_uses
+    async with _browser_lock:
+        if _browser is not None and (
+            not _browser.is_connected()
+            or _browser_uses >= BROWSER_MAX_USES
+            or time.monotonic() - _browser_started_at >= BROWSER_MAX_AGE
+        ):
+            logger.info("[SCRAPER] Recycling shared browser")
+            await _close_browser()
+        if _browser is None:
+            if _playwright is None:
+                _playwright = await async_playwright().start()
+            _browser = await _playwright.chromium.launch(
+                headless=True,
+                args=list(CHROMIUM_ARGS),
+                ignore_default_args=['--enable-automation'],
+            )
+            _browser_started_at = time.monotonic()
+            _browser_uses = 0
+        _browser_uses += 1
+        return _browser
+
+
+async def shutdown_browser() -> None:
+    """Close the shared browser and stop Playwright (call once on exit)."""
+    global _playwright
+    async with _browser_lock:
+        await _close_browser()
+        if _playwright is not None:
+            try:
+                await _playwright.stop()
+            except Exception:
+                pass
+            _playwright = None
 
 
 # ============================================================================
@@ -63,13 +263,20 @@ class FAHScraper:
 
     Attributes:
         config: Configuration dictionary with URLs and settings
-        browser: Playwright browser instance
-        context: Browser context for page isolation
+        browser: Shared Playwright browser instance (see acquire_browser)
+        context: Browser context for page isolation (owned by this scraper)
         control_page: Page object for local FAH control interface
         stats_page: Page object for global FAH stats
         _stats_cache: Cached (points, wus) tuple
-        _cache_timestamp: Unix timestamp of last cache update
-        _cache_ttl: Cache time-to-live in seconds (default: 300)
+        _cache_timestamp: Monotonic clock reading of last cache update
+        _control_loaded_at: Monotonic time the control page was last loaded (None = reload)
+        _control_error_logged: True while control page errors repeat (traceback logged once)
+        _control_cache: Cached (percents, project_ids, is_running) of the last read
+        _control_cache_timestamp: Monotonic clock reading of the last control read
+        _control_retry_at: Monotonic time before which control loads are skipped
+        _control_retry_step: Current control retry delay in seconds
+        _control_last_error: Message of the last control page failure
+        _cache_ttl: Current stats cache time-to-live in seconds (adaptive, starts at 300)
     """
 
     def __init__(self, config: Dict[str, Any]) -> None:
@@ -84,25 +291,62 @@ class FAHScraper:
         self.context = None
         self.control_page = None
         self.stats_page = None
+        self._control_loaded_at: Optional[float] = None
+        self._control_error_logged = False
+
+        # Control page retry backoff
+        self._control_retry_at: float = 0.0
+        self._control_retry_step: float = CONTROL_RETRY_INITIAL
+        self._control_last_error = ""
 
         # Caching
+        self._control_cache: Optional[Tuple[list, list, bool]] = None
+        self._control_cache_timestamp: float = 0
         self._stats_cache: Optional[Tuple[Optional[str], Optional[str]]] = None
         self._cache_timestamp: float = 0
-        self._cache_ttl: int = 300  # 5 minutes
+        self._cache_ttl: int = STATS_CACHE_TTL_DEFAULT
 
     async def initialize(self) -> None:
         """
-        Initialize the browser and pages.
+        Initialize the browser context and pages.
 
         Raises:
             Exception: If browser initialization fails
         """
-        p = async_playwright()
-        self.playwright = await p.start()
-        self.browser = await self.playwright.chromium.launch(headless=True)
+        self.browser = await acquire_browser()
         self.context = await self.browser.new_context()
         self.control_page = await self.context.new_page()
         self.stats_page = await self.context.new_page()
+        await self.stats_page.route("**/*", _route_stats)
+
+    async def _load_control_page(self) -> None:
+        """
+        Navigate the control page and wait for its data to render.
+
+        Raises:
+            Exception: If navigation fails (e.g. FAH client not running)
+        """
+        url = self.config['foldingathome']['web_url']
+        try:
+            await asyncio.wait_for(
+                self.control_page.goto(
+                    url,
+                    wait_until="domcontentloaded",
+                    timeout=CONTROL_LOAD_TIMEOUT * 1500
+                ),
+                CONTROL_LOAD_TIMEOUT
+            )
+        except asyncio.TimeoutError:
+            raise PlaywrightTimeoutError(f"Timed out after {CONTROL_LOAD_TIMEOUT:g}s loading {url}") from None
+        # The page fills in from the client after load, so wait for the
+        # elements read below instead of for the network to go idle
+        try:
+            await self.control_page.locator(CONTROL_READY_SELECTOR).first.wait_for(
+                state="attached", timeout=2000
+            )
+        except PlaywrightTimeoutError:
+            pass  # Nothing to show (e.g. no work units); read the page as is
+        self._control_loaded_at = time.monotonic()
 
     async def get_control_data(self) -> Tuple[list, list, bool]:
         """
@@ -114,52 +358,112 @@ class FAHScraper:
         To monitor a different PC, change 'foldingathome.web_url' in config.json to:
             http://localhost:7396/
 
+        The page is loaded once and then read in place on later calls, since
+        it keeps itself up to date. It is reloaded after an error, when it
+        shows no work, or after CONTROL_PAGE_MAX_AGE seconds, so a stopped
+        client is still detected by the navigation failing. Calls within
+        CONTROL_CACHE_TTL seconds of a successful read return that read.
+        After a failure, calls fail fast without touching the page until the
+        retry delay (CONTROL_RETRY_INITIAL doubling up to CONTROL_RETRY_MAX)
+        has passed.
+
         Returns:
             Tuple of (percent_complete, project_id, is_running)
 
         Raises:
             Exception: If scraping fails
         """
+        current_time = time.monotonic()
+        if self._control_cache and (current_time - self._control_cache_timestamp) < CONTROL_CACHE_TTL:
+            return self._control_cache
+        if current_time < self._control_retry_at:
+            raise Exception(f"Control page error: {self._control_last_error}")
         try:
-            await self.control_page.goto(
-                self.config['foldingathome']['web_url'],
-                wait_until="networkidle",
-                timeout=8000
-            )
+            loaded_at = self._control_loaded_at
+            if loaded_at is None or current_time - loaded_at >= CONTROL_PAGE_MAX_AGE:
+                await self._load_control_page()
+            # One round-trip for progress texts, project IDs and run state
+            snapshot = await self.control_page.evaluate(CONTROL_SNAPSHOT_JS, RE_PROJ_ID.pattern)
+            percent_elements = snapshot['prog']
             # Extract percent from .progress-text for each project
-            percent_elements = await self.control_page.locator('.progress-text').all_text_contents()
-            percents = [p.strip().replace('%','') for p in percent_elements if p.strip()] or ["0"]
-            proj_ids = RE_PROJ_ID.findall(await self.control_page.content()) or ["Active"]
-            is_running = await self.control_page.locator(".state-run").count() > 0
-            return percents, proj_ids, is_running
+            percents = [m.group() for p in percent_elements if (m := RE_PERCENT.search(p))] or ["0"]
+            # Matched against rendered text only, so markup/attribute values
+            # can't produce false matches
+            proj_ids = snapshot['ids'] or ["Active"]
+            is_running = snapshot['running']
+            if not percent_elements and not is_running:
+                # Idle or disconnected page: confirm with a fresh load next time
+                self._control_loaded_at = None
+            self._control_error_logged = False
+            self._control_retry_at = 0.0
+            self._control_retry_step = CONTROL_RETRY_INITIAL
+            self._control_cache = (percents, proj_ids, is_running)
+            self._control_cache_timestamp = current_time
+            return self._control_cache
         except Exception as e:
-            logger.error(f"FAH control page error: {e}", exc_info=True)
+            self._control_loaded_at = None
+            self._control_cache = None
+            self._control_last_error = str(e)
+            self._control_retry_at = time.monotonic() + self._control_retry_step
+            self._control_retry_step = min(self._control_retry_step * 2, CONTROL_RETRY_MAX)
+            # While the client stays down this fails every tick; log the
+            # traceback for the first failure only
+            if not self._control_error_logged:
+                logger.error(f"FAH control page error: {e}", exc_info=True)
+                self._control_error_logged = True
+            elif logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"FAH control page error (repeated): {e}")
             raise Exception(f"Control page error: {e}")
 
     async def get_global_stats(self) -> Tuple[Optional[str], Optional[str]]:
         """
         Scrape the FAH stats page for global points and WUs.
-        Uses cache to reduce scraper load with 5-minute TTL.
+        Uses cache to reduce scraper load. The TTL adapts between
+        STATS_CACHE_TTL_MIN and STATS_CACHE_TTL_MAX: it doubles after a
+        refresh that finds the same totals and halves after one that doesn't.
 
         Returns:
             Tuple of (points, work_units) or (None, None) on error
         """
-        # Check cache
-        current_time = time.time()
+        # Check cache (monotonic clock so wall-clock/NTP jumps can't skew the TTL)
+        current_time = time.monotonic()
         if self._stats_cache and (current_time - self._cache_timestamp) < self._cache_ttl:
             return self._stats_cache
         try:
             await self.stats_page.goto(
                 self.config['foldingathome']['stats_url'],
-                wait_until="networkidle",
+                wait_until="domcontentloaded",
                 timeout=10000
             )
-            content = await self.stats_page.content()
-
-            points = RE_POINTS.findall(content)
-            wus = RE_WUS.findall(content)
-
-            result = (points[0] if points else None, wus[0] if wus else None)
+            # Analytics and other background requests keep the network busy,
+            # so wait for the totals themselves rather than network idle
+            try:
+                await self.stats_page.locator(STATS_READY_SELECTOR).first.wait_for(
+                    state="attached", timeout=5000
+                )
+            except PlaywrightTimeoutError:
+                pass  # Parse whatever rendered; missing totals come back as None
+            # Just the two elements' text rather than the whole serialized page
+            points_text, wus_text = await self.stats_page.evaluate(STATS_SNAPSHOT_JS)
+            points = RE_COUNT.search(points_text) if points_text else None
+            wus = RE_COUNT.search(wus_text) if wus_text else None
+
+            if points and wus:
+                result = (points.group(), wus.group())
+            else:
+                # Markup differs from what the selectors expect; scan the HTML
+                content = await self.stats_page.content()
+                result = (
+                    _find_near(content, 'class="user-points"', RE_POINTS),
+                    _find_near(content, 'class="user-wus"', RE_WUS),
+                )
+
+            # Adapt the TTL to how often the totals actually change
+            if result[0] is not None and self._stats_cache is not None:
+                if result == self._stats_cache:
+                    self._cache_ttl = min(self._cache_ttl * 2, STATS_CACHE_TTL_MAX)
+                else:
+                    self._cache_ttl = max(self._cache_ttl // 2, STATS_CACHE_TTL_MIN)
 
             # Cache result
             self._stats_cache = result
@@ -171,19 +475,20 @@ class FAHScraper:
             return None, None
 
     async def close(self) -> None:
-        """Clean up browser resources."""
+        """
+        Clean up this scraper's context and pages.
+
+        The shared browser stays running for the next scraper; it is closed
+        by shutdown_browser() on application exit.
+        """
         if self.context:
             try:
                 await self.context.close()
             except Exception:
                 pass
-        if self.browser:
-            try:
-                await self.browser.close()
-            except Exception:
-                pass
-        if hasattr(self, 'playwright'):
-            try:
-                await self.playwright.stop()
-            except Exception:
-                pass
+        self.context = None
+        self.control_page = None
+        self.stats_page = None
+        self.browser = None
+        self._control_loaded_at = None
+        self._control_cache = None
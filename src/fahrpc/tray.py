@@ -25,30 +25,100 @@ Example usage:
 """
 
 import ctypes
+import functools
 import logging
+import os
 import sys
 import threading
-from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 import pystray
 from PIL import Image
 
 from fahrpc.config import APP_NAME
 
+__all__ = ["TrayIcon", "set_console_visibility"]
+
 logger = logging.getLogger(APP_NAME.upper())
 
+# Largest size a tray icon is drawn at (16px at 400% display scaling)
+TRAY_ICON_SIZE = 64
+
+# Console window handle (fixed for the process), looked up on first use
+_console_hwnd: Optional[int] = None
+
+
 def set_console_visibility(visible: bool) -> None:
     """
     Toggle Windows console window visibility.
 
+    The console handle is looked up once. ShowWindow is still called on
+    every request, so "show" also restores a console the user minimized.
+
     Args:
         visible: True to show, False to hide console
     """
-    if sys.platform == "win32":
-        hwnd = ctypes.windll.kernel32.GetConsoleWindow()
-        if hwnd != 0:
-            ctypes.windll.user32.ShowWindow(hwnd, 1 if visible else 0)
+    global _console_hwnd
+    if sys.platform != "win32":
+        return
+    if _console_hwnd is None:
+        _console_hwnd = ctypes.windll.kernel32.GetConsoleWindow()
+    if _console_hwnd != 0:
+        ctypes.windll.user32.ShowWindow(_console_hwnd, 1 if visible else 0)
+
+@functools.lru_cache(maxsize=4)
+def _load_icon_cached(icon_filename: str) -> Image.Image:
+    """
+    Find and decode the tray icon once per process.
+
+    The image is decoded once and shrunk to TRAY_ICON_SIZE as RGBA, the
+    form the tray actually draws, so the full-size bitmap isn't kept in
+    memory or re-scaled when pystray converts it to a Windows icon. Later
+    TrayIcon instances reuse it without probing the filesystem again. The
+    returned image is shared by every caller; take a copy before changing it.
+
+    Args:
+        icon_filename: Icon file name or path from config['display']['icon_file']
+
+    Returns:
+        PIL Image object for tray icon (a red square if the file is missing)
+    """
+    # Try multiple locations in order:
+    # 1. Relative to current working directory (most common, and also how
+    #    an absolute path in the config resolves: join() keeps it as is)
+    # 2. Relative to src/fahrpc module root
+    # 3. Relative to src/
+    # 4. Relative to project root (three levels up from tray.py)
+    module_dir = os.path.dirname(os.path.abspath(__file__))
+    search_dirs = (
+        os.getcwd(),
+        module_dir,
+        os.path.dirname(module_dir),
+        os.path.dirname(os.path.dirname(module_dir)),
+    )
+
+    # Remove duplicates while preserving order (abspath is pure string
+    # normalization, so this costs no filesystem calls)
+    unique_paths = list(dict.fromkeys(
+        os.path.abspath(os.path.join(directory, icon_filename)) for directory in search_dirs
+    ))
+
+    # One stat per candidate, stopping at the first hit
+    for icon_path in unique_paths:
+        try:
+            if os.path.isfile(icon_path):
+                logger.debug(f"Loading icon from: {icon_path}")
+                with Image.open(icon_path) as image:
+                    icon = image.convert('RGBA')
+                icon.thumbnail((TRAY_ICON_SIZE, TRAY_ICON_SIZE), Image.LANCZOS)
+                return icon
+        except Exception as e:
+            logger.error(f"Failed to load icon from {icon_path}: {e}", exc_info=True)
+            continue
+
+    # Fallback: create a red circle icon
+    logger.error(f"Could not find icon file '{icon_filename}' in any search path. Searched: {unique_paths}")
+    return Image.new('RGBA', (TRAY_ICON_SIZE, TRAY_ICON_SIZE), color=(180, 0, 0, 255))
 
 class TrayIcon:
     """Manages the system tray icon and menu interactions."""
@@ -74,45 +144,10 @@ class TrayIcon:
         Load icon image from file or create default.
 
         Returns:
-            PIL Image object for tray icon
+            PIL Image object for tray icon (a private copy of the cached image)
         """
-        icon_filename = self.config['display']['icon_file']
-
-        # Try multiple locations in order:
-        # 1. Relative to current working directory (most common)
-        # 2. Absolute path if specified
-        # 3. Relative to src/fahrpc module root
-        # 4. Relative to project root (three levels up from tray.py)
-        possible_paths = [
-            Path.cwd() / icon_filename,  # Current working directory
-            Path(icon_filename).resolve(),  # Absolute path
-            Path(__file__).parent / icon_filename,  # Same directory as tray.py
-            Path(__file__).parent.parent / icon_filename,  # src/fahrpc/../ (src/)
-            Path(__file__).parent.parent.parent / icon_filename,  # Project root
-        ]
-
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_paths = []
-        for p in possible_paths:
-            p_str = str(p.resolve())
-            if p_str not in seen:
-                seen.add(p_str)
-                unique_paths.append(p)
-
-        for icon_path in unique_paths:
-            try:
-                if icon_path.exists():
-                    logger.debug(f"Loading icon from: {icon_path}")
-                    return Image.open(icon_path)
-            except Exception as e:
-                logger.error(f"Failed to load icon from {icon_path}: {e}", exc_info=True)
-                continue
-
-        # Fallback: create a red circle icon
-        searched_paths = [str(p) for p in unique_paths]
-        logger.error(f"Could not find icon file '{icon_filename}' in any search path. Searched: {searched_paths}")
-        return Image.new('RGB', (64, 64), color=(180, 0, 0))
+        # A copy, so a caller drawing on it can't alter the cached icon
+        return _load_icon_cached(self.config['display']['icon_file']).copy()
 
     def _create_menu(self) -> tuple:
         """